@@ -7,22 +7,61 @@ managing the coordination service.
 
 import os
 import sys
-import argparse
 import logging
 import signal
-import time
-from typing import Optional, Dict, Any, List
+import threading
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 
 from . import __version__, load_settings, CoordinationService, CoordinatorError
+from .mcp import install_fast_loop
 
+if TYPE_CHECKING:
+    import argparse
 
-def parse_args() -> argparse.Namespace:
+
+# Option flags mapped to their destination names
+_FLAG_MAP = {
+    "-c": "config_file",
+    "--config": "config_file",
+    "-p": "project_root",
+    "--project": "project_root",
+    "--cursor-host": "cursor_ai_host",
+    "--cursor-port": "cursor_ai_port",
+    "--coordination-port": "coordination_port",
+    "-d": "lldb_database_path",
+    "--database": "lldb_database_path",
+    "--log-level": "log_level",
+    "--log-file": "log_file",
+    "--metrics-file": "metrics_file",
+}
+
+# Switch flags mapped to their destination names
+_SWITCH_MAP = {
+    "--uvloop": "use_uvloop",
+}
+
+# Destinations that take integer values
+_INT_FIELDS = {"cursor_ai_port", "coordination_port"}
+
+# Allowed values for restricted destinations
+_CHOICES = {
+    "log_level": ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
+}
+
+
+def _build_parser() -> "argparse.ArgumentParser":
     """
-    Parse command-line arguments.
+    Build the full argparse parser.
+    
+    The parser is only used for --help output and error reporting, so
+    argparse is imported lazily.
     
     Returns:
-        argparse.Namespace: Parsed arguments
+        argparse.ArgumentParser: Argument parser
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Cursor AI Coordination Runtime MCP Integration"
     )
@@ -74,7 +113,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--log-level",
         dest="log_level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=list(_CHOICES["log_level"]),
         help="Log level"
     )
     
@@ -90,7 +129,74 @@ def parse_args() -> argparse.Namespace:
         help="Path to metrics file"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--uvloop",
+        dest="use_uvloop",
+        action="store_true",
+        default=None,
+        help="Run the MCP client on uvloop, if installed"
+    )
+    
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> SimpleNamespace:
+    """
+    Parse command-line arguments.
+    
+    Common invocations are handled by a small table-driven parser to keep
+    startup fast. Help requests and malformed command lines are delegated
+    to argparse so users get the usual help and error messages.
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    
+    Returns:
+        SimpleNamespace: Parsed arguments
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    args = dict.fromkeys(set(_FLAG_MAP.values()) | set(_SWITCH_MAP.values()))
+    i = 0
+    
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        
+        if arg == "--version":
+            print(f"{os.path.basename(sys.argv[0])} {__version__}")
+            sys.exit(0)
+        
+        if arg in _SWITCH_MAP:
+            args[_SWITCH_MAP[arg]] = True
+            continue
+        
+        flag, has_value, value = arg.partition("=")
+        dest = _FLAG_MAP.get(flag)
+        
+        if dest is None or (has_value and not flag.startswith("--")):
+            # Help or an argument we can't handle: let argparse report it
+            return SimpleNamespace(**vars(_build_parser().parse_args(argv)))
+        
+        if not has_value:
+            # A value that looks like an option is for argparse to reject
+            if i >= len(argv) or argv[i].startswith("-"):
+                return SimpleNamespace(**vars(_build_parser().parse_args(argv)))
+            value = argv[i]
+            i += 1
+        
+        if dest in _INT_FIELDS:
+            try:
+                value = int(value)
+            except ValueError:
+                return SimpleNamespace(**vars(_build_parser().parse_args(argv)))
+        elif dest in _CHOICES and value not in _CHOICES[dest]:
+            return SimpleNamespace(**vars(_build_parser().parse_args(argv)))
+        
+        args[dest] = value
+    
+    return SimpleNamespace(**args)
 
 
 def main() -> int:
@@ -107,9 +213,14 @@ def main() -> int:
     settings = load_settings(config_file=args.config_file)
     
     # Override settings with command-line arguments
-    for arg_name, arg_value in vars(args).items():
-        if arg_value is not None and arg_name != "config_file":
-            setattr(settings, arg_name, arg_value)
+    settings.update(**{
+        arg_name: arg_value for arg_name, arg_value in vars(args).items()
+        if arg_value is not None and arg_name != "config_file"
+    })
+    
+    # Use uvloop for the service's event loop when requested
+    if settings.use_uvloop:
+        install_fast_loop()
     
     # Create and start the service
     service = CoordinationService(settings)
@@ -118,17 +229,26 @@ def main() -> int:
         service.start()
         
         # Set up signal handlers
+        shutdown_event = threading.Event()
+        
         def handle_signal(signum, frame):
             print("\nShutting down...")
             service.stop()
-            sys.exit(0)
+            shutdown_event.set()
         
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
         
-        # Keep the main thread alive
-        while True:
-            time.sleep(1)
+        # Block the main thread until a shutdown signal arrives
+        if hasattr(signal, "pause"):
+            while not shutdown_event.is_set():
+                signal.pause()
+        else:
+            # Windows: an untimed Event.wait() can't be interrupted by
+            # Ctrl+C, so wake up periodically to let the handler run
+            while not shutdown_event.wait(1):
+                pass
+        return 0
             
     except CoordinatorError as e:
         print(f"Error: {str(e)}", file=sys.stderr)
@@ -7,15 +7,106 @@ through ctypes bindings.
 """
 
 import ctypes
+import logging
+import operator
 import os
 import platform
 import threading
-from typing import Optional, Callable, Dict, List, Any, Tuple
+from functools import lru_cache
+from typing import Optional, Callable, Dict, List, Any, Tuple, Union
 
 from .caicr_types import (
     CAICRStatus, CAICROperationType, CAICROperation, CAICRConfig,
-    CAICR_OPERATION_CALLBACK, CAICRInstancePtr
+    CAICR_OPERATION_CALLBACK, CAICR_OPERATION_LAYOUT, CAICRInstancePtr, Operation
 )
+from ..config.settings import Settings
+
+# Set up module logger
+logger = logging.getLogger(__name__)
+
+
+# Operation types by raw value, avoiding IntEnum construction per node
+_OPERATION_TYPES = {op_type.value: op_type for op_type in CAICROperationType}
+
+
+@lru_cache(maxsize=1024)
+def _encode_cached(value: str) -> bytes:
+    """Encode a frequently repeated string (file path, instance ID) as UTF-8."""
+    return value.encode('utf-8')
+
+
+# CAICRConfig fields in _initialize argument order, fetched in one C-level
+# call from either a configuration dict or a Settings object
+_CONFIG_KEYS = (
+    "instance_id", "project_root", "lldb_database_path", "coordination_port",
+    "sync_interval_ms", "max_history_entries", "encryption_enabled"
+)
+_CONFIG_KEYS_SET = frozenset(_CONFIG_KEYS)
+_CONFIG_ITEMS = operator.itemgetter(*_CONFIG_KEYS)
+_CONFIG_ATTRS = operator.attrgetter(*_CONFIG_KEYS)
+
+# Raw status value for success, compared on every C call
+_SUCCESS = CAICRStatus.CAICR_SUCCESS.value
+
+# Platform name, resolved once per process
+_SYSTEM = platform.system()
+
+
+@lru_cache(maxsize=None)
+def _resolve_library_path() -> Optional[str]:
+    """
+    Locate the CAICR library for the current platform.
+    
+    The CAICR_LIBRARY_PATH environment variable is honored first, so most
+    deployments resolve the library with a single stat. The result is
+    cached for the lifetime of the process.
+    
+    Returns:
+        Optional[str]: Library path, the bare library name if it was not
+            found (letting the loader search for it), or None if the
+            platform is unsupported
+    """
+    # Check if library path is specified in environment variable
+    env_lib_path = os.environ.get("CAICR_LIBRARY_PATH")
+    if env_lib_path and os.path.isfile(env_lib_path):
+        return env_lib_path
+    
+    package_lib_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'lib')
+    
+    # Look for the library in common locations
+    if _SYSTEM == "Darwin":  # macOS
+        lib_name = "libcaicr.dylib"
+        search_paths = [
+            package_lib_dir,
+            "/usr/local/lib",
+            "/usr/lib",
+            "/opt/homebrew/lib"
+        ]
+    elif _SYSTEM == "Linux":
+        lib_name = "libcaicr.so"
+        search_paths = [
+            package_lib_dir,
+            "/usr/local/lib",
+            "/usr/lib"
+        ]
+    elif _SYSTEM == "Windows":
+        lib_name = "caicr.dll"
+        search_paths = [
+            package_lib_dir,
+            os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "CAICR", "bin")
+        ]
+    else:
+        return None
+    
+    # Check if the library exists in any of the search paths; isfile is a
+    # single stat that stops at the first match
+    for path in search_paths:
+        lib_path = os.path.join(path, lib_name)
+        if os.path.isfile(lib_path):
+            return lib_path
+    
+    # If not found, return a default path and let the loader handle the error
+    return lib_name
 
 
 class CAICRBindingError(Exception):
@@ -55,11 +146,19 @@ class CAICRBinding:
             # Set function argument and return types
             self._configure_function_signatures()
             
-            # Initialize callback registry
+            # Initialize callback registry (copy-on-write, see
+            # register_operation_callback)
             self._callback_registry = {}
             self._callback_counter = 0
             self._callback_lock = threading.Lock()
             
+            # A single C trampoline shared by all registrations; callbacks
+            # are told apart by the callback ID passed as user_data
+            self._shared_c_callback = CAICR_OPERATION_CALLBACK(self._operation_callback_trampoline)
+            
+            # Per-thread reusable structures for submit_operation
+            self._thread_local = threading.local()
+            
         except OSError as e:
             raise CAICRBindingError(
                 CAICRStatus.CAICR_ERROR_UNKNOWN,
@@ -68,49 +167,14 @@ class CAICRBinding:
     
     def _get_library_path(self) -> str:
         """Determine the library path based on the platform."""
-        system = platform.system()
-        
-        # Look for the library in common locations
-        if system == "Darwin":  # macOS
-            lib_name = "libcaicr.dylib"
-            search_paths = [
-                os.path.join(os.path.dirname(__file__), '..', '..', 'lib'),
-                "/usr/local/lib",
-                "/usr/lib",
-                "/opt/homebrew/lib"
-            ]
-        elif system == "Linux":
-            lib_name = "libcaicr.so"
-            search_paths = [
-                os.path.join(os.path.dirname(__file__), '..', '..', 'lib'),
-                "/usr/local/lib",
-                "/usr/lib"
-            ]
-        elif system == "Windows":
-            lib_name = "caicr.dll"
-            search_paths = [
-                os.path.join(os.path.dirname(__file__), '..', '..', 'lib'),
-                os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "CAICR", "bin")
-            ]
-        else:
+        lib_path = _resolve_library_path()
+        if lib_path is None:
             raise CAICRBindingError(
                 CAICRStatus.CAICR_ERROR_UNKNOWN,
-                f"Unsupported platform: {system}"
+                f"Unsupported platform: {_SYSTEM}"
             )
         
-        # Check if the library exists in any of the search paths
-        for path in search_paths:
-            lib_path = os.path.join(path, lib_name)
-            if os.path.exists(lib_path):
-                return lib_path
-        
-        # Check if library path is specified in environment variable
-        env_lib_path = os.environ.get("CAICR_LIBRARY_PATH")
-        if env_lib_path and os.path.exists(env_lib_path):
-            return env_lib_path
-        
-        # If not found, return a default path and let the loader handle the error
-        return lib_name
+        return lib_path
     
     def _configure_function_signatures(self) -> None:
         """Configure function signatures for the C library."""
@@ -152,19 +216,39 @@ class CAICRBinding:
         self.lib.caicr_shutdown.argtypes = [CAICRInstancePtr]
         self.lib.caicr_shutdown.restype = ctypes.c_int
     
+    def _get_operation_buffer(self) -> Tuple[CAICROperation, Any]:
+        """
+        Get the calling thread's reusable operation structure.
+        
+        Returns:
+            Tuple[CAICROperation, Any]: The structure and a cached byref()
+                to it, which stays valid because the structure is reused
+        """
+        thread_local = self._thread_local
+        buffer = getattr(thread_local, "operation", None)
+        if buffer is None:
+            buffer = CAICROperation()
+            thread_local.operation = buffer
+            thread_local.operation_ref = ctypes.byref(buffer)
+        return buffer, thread_local.operation_ref
+    
     def _check_status(self, status: int, operation: str) -> None:
         """Check the status returned by a C library function and raise an error if needed."""
-        if status != CAICRStatus.CAICR_SUCCESS:
-            try:
-                status_enum = CAICRStatus(status)
-                status_name = status_enum.name
-            except ValueError:
-                status_name = f"UNKNOWN_STATUS_{status}"
-            
-            raise CAICRBindingError(
-                status,
-                f"Operation '{operation}' failed with status {status_name}"
-            )
+        # Plain integer compare on the success path, no IntEnum machinery
+        if status == _SUCCESS:
+            return
+        
+        try:
+            status_enum = CAICRStatus(status)
+            status_name = status_enum.name
+        except ValueError:
+            status_enum = CAICRStatus.CAICR_ERROR_UNKNOWN
+            status_name = f"UNKNOWN_STATUS_{status}"
+        
+        raise CAICRBindingError(
+            status_enum,
+            f"Operation '{operation}' failed with status {status_name}"
+        )
     
     def _operation_callback_trampoline(self, operations_ptr, user_data) -> None:
         """
@@ -176,44 +260,55 @@ class CAICRBinding:
         # Extract the callback ID from user_data
         callback_id = ctypes.cast(user_data, ctypes.POINTER(ctypes.c_int)).contents.value
         
-        # Get the Python callback function
-        with self._callback_lock:
-            callback_entry = self._callback_registry.get(callback_id)
-            if callback_entry is None:
-                return
-            
-            callback_func = callback_entry["callback"]
+        # Get the Python callback function. The registry is replaced rather
+        # than mutated, so it can be read without taking the lock.
+        callback_entry = self._callback_registry.get(callback_id)
+        if callback_entry is None:
+            return
         
-        # Convert linked list of operations to Python list
-        operations = []
-        current = operations_ptr
+        callback_func = callback_entry["callback"]
         
-        while current and current.contents:
-            op = current.contents
+        # Convert linked list of operations to Python list in a single pass.
+        # Each node is copied out with one string_at and unpacked with one
+        # struct call rather than a ctypes descriptor access per field.
+        operations = []
+        append = operations.append
+        operation_types = _OPERATION_TYPES
+        unpack = CAICR_OPERATION_LAYOUT.unpack
+        node_size = CAICR_OPERATION_LAYOUT.size
+        string_at = ctypes.string_at
+        address = ctypes.cast(operations_ptr, ctypes.c_void_p).value
+        
+        while address:
+            (
+                raw_type, file_path, line_number, column_number, content,
+                content_length, timestamp_ns, instance_id, operation_id, address
+            ) = unpack(string_at(address, node_size))
             
-            # Convert C structure to Python dict
-            operation = {
-                "type": CAICROperationType(op.type),
-                "file_path": op.file_path.decode('utf-8') if op.file_path else None,
-                "line_number": op.line_number,
-                "column_number": op.column_number,
-                "content": op.content.decode('utf-8') if op.content else None,
-                "content_length": op.content_length,
-                "timestamp_ns": op.timestamp_ns,
-                "instance_id": op.instance_id.decode('utf-8') if op.instance_id else None,
-                "operation_id": op.operation_id
-            }
+            op_type = operation_types.get(raw_type)
+            if op_type is None:
+                op_type = CAICROperationType(raw_type)
             
-            operations.append(operation)
-            current = op.next
+            # String fields must be copied while the C memory is still valid
+            append(Operation(
+                op_type,
+                (string_at(file_path).decode('utf-8') or None) if file_path else None,
+                line_number,
+                column_number,
+                (string_at(content).decode('utf-8') or None) if content else None,
+                content_length,
+                timestamp_ns,
+                (string_at(instance_id).decode('utf-8') or None) if instance_id else None,
+                operation_id
+            ))
         
         # Call the Python callback
         try:
             callback_func(operations)
         except Exception as e:
             # Log the exception but don't propagate it to C code
-            import logging
-            logging.exception(f"Exception in operation callback: {str(e)}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.exception("Exception in operation callback: %s", e)
     
     def initialize(self, config: Dict[str, Any]) -> CAICRInstancePtr:
         """
@@ -235,15 +330,57 @@ class CAICRBinding:
         Raises:
             CAICRBindingError: If initialization fails
         """
+        missing = _CONFIG_KEYS_SET - config.keys()
+        if missing:
+            raise CAICRBindingError(
+                CAICRStatus.CAICR_ERROR_INVALID_PARAMETER,
+                f"Missing configuration keys: {', '.join(sorted(missing))}"
+            )
+        
+        return self._initialize(*_CONFIG_ITEMS(config))
+    
+    def initialize_from_settings(
+        self, settings: Settings, instance_id: Optional[str] = None
+    ) -> CAICRInstancePtr:
+        """
+        Initialize the CAICR runtime from a Settings object.
+        
+        Args:
+            settings: Service configuration settings
+            instance_id: Instance identifier overriding settings.instance_id
+        
+        Returns:
+            CAICRInstancePtr: Opaque pointer to the CAICR instance
+        
+        Raises:
+            CAICRBindingError: If initialization fails
+        """
+        values = _CONFIG_ATTRS(settings)
+        if instance_id is not None:
+            values = (instance_id,) + values[1:]
+        
+        return self._initialize(*values)
+    
+    def _initialize(
+        self,
+        instance_id: str,
+        project_root: str,
+        lldb_database_path: str,
+        coordination_port: int,
+        sync_interval_ms: int,
+        max_history_entries: int,
+        encryption_enabled: bool
+    ) -> CAICRInstancePtr:
+        """Create the configuration structure and call caicr_initialize."""
         # Create the configuration structure
         c_config = CAICRConfig(
-            instance_id=config["instance_id"].encode('utf-8'),
-            project_root=config["project_root"].encode('utf-8'),
-            lldb_database_path=config["lldb_database_path"].encode('utf-8'),
-            coordination_port=config["coordination_port"],
-            sync_interval_ms=config["sync_interval_ms"],
-            max_history_entries=config["max_history_entries"],
-            encryption_enabled=config["encryption_enabled"]
+            instance_id=instance_id.encode('utf-8'),
+            project_root=project_root.encode('utf-8'),
+            lldb_database_path=lldb_database_path.encode('utf-8'),
+            coordination_port=coordination_port,
+            sync_interval_ms=sync_interval_ms,
+            max_history_entries=max_history_entries,
+            encryption_enabled=encryption_enabled
         )
         
         # Create a pointer to receive the instance
@@ -257,7 +394,7 @@ class CAICRBinding:
         return instance_ptr
     
     def register_operation_callback(
-        self, instance: CAICRInstancePtr, callback: Callable[[List[Dict[str, Any]]], None]
+        self, instance: CAICRInstancePtr, callback: Callable[[List[Operation]], None]
     ) -> int:
         """
         Register a callback for operation notifications.
@@ -277,20 +414,25 @@ class CAICRBinding:
             callback_id = self._callback_counter
             self._callback_counter += 1
             
-            # Store the callback in the registry
-            self._callback_registry[callback_id] = {
+            # Create the user_data pointer with the callback ID once; the
+            # registry entry keeps the integer alive while C holds its address
+            callback_id_value = ctypes.c_int(callback_id)
+            
+            # Store the callback in a copy of the registry and swap it in
+            callback_entry = {
                 "callback": callback,
-                "c_callback": CAICR_OPERATION_CALLBACK(self._operation_callback_trampoline)
+                "user_data": callback_id_value,
+                "user_data_ptr": ctypes.c_void_p(ctypes.addressof(callback_id_value))
             }
-        
-        # Create a user_data pointer with the callback ID
-        user_data = ctypes.pointer(ctypes.c_int(callback_id))
+            registry = dict(self._callback_registry)
+            registry[callback_id] = callback_entry
+            self._callback_registry = registry
         
         # Call the C function
         status = self.lib.caicr_register_operation_callback(
             instance,
-            self._callback_registry[callback_id]["c_callback"],
-            ctypes.cast(user_data, ctypes.c_void_p)
+            self._shared_c_callback,
+            callback_entry["user_data_ptr"]
         )
         
         self._check_status(status, "register_operation_callback")
@@ -305,17 +447,19 @@ class CAICRBinding:
         """
         with self._callback_lock:
             if callback_id in self._callback_registry:
-                del self._callback_registry[callback_id]
+                registry = dict(self._callback_registry)
+                del registry[callback_id]
+                self._callback_registry = registry
     
     def submit_operation(
-        self, instance: CAICRInstancePtr, operation: Dict[str, Any]
+        self, instance: CAICRInstancePtr, operation: Union[Operation, Dict[str, Any]]
     ) -> None:
         """
         Submit an operation for execution and distribution.
         
         Args:
             instance: CAICR instance pointer
-            operation: Operation dictionary with the following keys:
+            operation: Operation object, or dictionary with the following keys:
                 - type: Operation type (CAICROperationType)
                 - file_path: Path to the affected file
                 - line_number: Affected line number
@@ -326,22 +470,37 @@ class CAICRBinding:
         Raises:
             CAICRBindingError: If submission fails
         """
-        # Convert operation dictionary to C structure
-        c_operation = CAICROperation(
-            type=operation["type"].value,
-            file_path=operation["file_path"].encode('utf-8') if operation["file_path"] else None,
-            line_number=operation["line_number"],
-            column_number=operation["column_number"],
-            content=operation["content"].encode('utf-8') if operation["content"] else None,
-            content_length=len(operation["content"]) if operation["content"] else 0,
-            timestamp_ns=0,  # Will be set by the runtime
-            instance_id=operation["instance_id"].encode('utf-8') if operation["instance_id"] else None,
-            operation_id=0,  # Will be set by the runtime
-            next=None
-        )
+        # Populate the thread's reusable C structure in place
+        c_operation, c_operation_ref = self._get_operation_buffer()
+        
+        if isinstance(operation, Operation):
+            op_type = operation.type
+            file_path = operation.file_path
+            line_number = operation.line_number
+            column_number = operation.column_number
+            content = operation.content
+            instance_id = operation.instance_id
+        else:
+            op_type = operation["type"]
+            file_path = operation["file_path"]
+            line_number = operation["line_number"]
+            column_number = operation["column_number"]
+            content = operation["content"]
+            instance_id = operation["instance_id"]
+        
+        c_operation.type = op_type.value
+        c_operation.file_path = _encode_cached(file_path) if file_path else None
+        c_operation.line_number = line_number
+        c_operation.column_number = column_number
+        c_operation.content = content.encode('utf-8') if content else None
+        c_operation.content_length = len(content) if content else 0
+        c_operation.timestamp_ns = 0  # Will be set by the runtime
+        c_operation.instance_id = _encode_cached(instance_id) if instance_id else None
+        c_operation.operation_id = 0  # Will be set by the runtime
+        c_operation.next = None
         
         # Call the C function
-        status = self.lib.caicr_submit_operation(instance, ctypes.byref(c_operation))
+        status = self.lib.caicr_submit_operation(instance, c_operation_ref)
         self._check_status(status, "submit_operation")
     
     def undo(self, instance: CAICRInstancePtr) -> None:
@@ -7,6 +7,7 @@ with the CAICR C library through ctypes.
 """
 
 import ctypes
+import struct
 from enum import IntEnum
 from typing import Optional, List, Dict, Any, Callable
 
@@ -53,6 +54,50 @@ CAICROperation._fields_ = [
     ("next", ctypes.POINTER(CAICROperation))
 ]
 
+# Native-aligned struct layout mirroring CAICROperation, used to read all
+# fixed-size fields of a node (string fields as raw pointers) in one call
+CAICR_OPERATION_LAYOUT = struct.Struct("@iPIIPNQPQP")
+assert CAICR_OPERATION_LAYOUT.size == ctypes.sizeof(CAICROperation)
+
+
+class Operation:
+    """
+    Python representation of a CAICR operation.
+    
+    Uses __slots__ rather than a dict per operation, since operations are
+    created for every node delivered by the C callback.
+    """
+    __slots__ = (
+        "type", "file_path", "line_number", "column_number", "content",
+        "content_length", "timestamp_ns", "instance_id", "operation_id"
+    )
+    
+    def __init__(
+        self,
+        type: CAICROperationType,
+        file_path: Optional[str] = None,
+        line_number: int = 0,
+        column_number: int = 0,
+        content: Optional[str] = None,
+        content_length: int = 0,
+        timestamp_ns: int = 0,
+        instance_id: Optional[str] = None,
+        operation_id: int = 0
+    ):
+        self.type = type
+        self.file_path = file_path
+        self.line_number = line_number
+        self.column_number = column_number
+        self.content = content
+        self.content_length = content_length
+        self.timestamp_ns = timestamp_ns
+        self.instance_id = instance_id
+        self.operation_id = operation_id
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the operation to a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class CAICRConfig(ctypes.Structure):
     """Configuration structure for CAICR initialization."""
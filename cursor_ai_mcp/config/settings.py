@@ -7,16 +7,37 @@ coordination service.
 """
 
 import os
+import copy
 import json
 import logging
-from typing import Dict, Any, Optional, List, Tuple, Union
-from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, Union, Callable, Iterable, get_type_hints
+from dataclasses import dataclass, field, fields, replace
 import uuid
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 # Set up module logger
 logger = logging.getLogger(__name__)
 
 
+if orjson is not None:
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+else:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
 @dataclass
 class Settings:
     """
@@ -43,6 +64,11 @@ class Settings:
     # Cursor AI MCP configuration
     cursor_ai_host: str = "127.0.0.1"
     cursor_ai_port: int = 15000
+    use_uvloop: bool = False
+    
+    # Reconnect backoff configuration (seconds)
+    reconnect_initial_delay: float = 5.0
+    max_reconnect_delay: float = 60.0
     
     # Logging configuration
     log_level: str = "INFO"
@@ -62,29 +88,25 @@ class Settings:
         
         Environment variables are prefixed with CAICR_ and upper-cased.
         For example, instance_id becomes CAICR_INSTANCE_ID.
+        
+        The parsed result is memoized per snapshot of the CAICR_ variables,
+        so repeated calls with an unchanged environment return a copy of a
+        cached prototype instead of re-parsing every variable.
+        """
+        return _env_prototype(cls, _env_snapshot()).copy()
+    
+    @classmethod
+    def _parse_env(cls, env: Iterable[Tuple[str, str]]) -> 'Settings':
+        """
+        Parse settings from environment variables (uncached).
+        
+        Args:
+            env: CAICR_ prefixed environment variable items
         """
         settings = cls()
         
-        # Get settings from environment variables
-        for field_name in settings.__annotations__:
-            env_name = f"CAICR_{field_name.upper()}"
-            env_value = os.environ.get(env_name)
-            
-            if env_value is not None:
-                field_type = settings.__annotations__[field_name]
-                
-                try:
-                    # Convert to the appropriate type
-                    if field_type == str or field_type == Optional[str]:
-                        setattr(settings, field_name, env_value)
-                    elif field_type == int:
-                        setattr(settings, field_name, int(env_value))
-                    elif field_type == bool:
-                        setattr(settings, field_name, env_value.lower() in ("true", "yes", "1"))
-                    elif field_type == Dict[str, Any]:
-                        setattr(settings, field_name, json.loads(env_value))
-                except Exception as e:
-                    logger.warning(f"Failed to convert environment variable {env_name}: {str(e)}")
+        for field_name, value in _env_values(env).items():
+            setattr(settings, field_name, value)
         
         return settings
     
@@ -102,30 +124,28 @@ class Settings:
         Raises:
             ValueError: If the file doesn't exist or contains invalid JSON
         """
-        if not os.path.exists(file_path):
-            raise ValueError(f"Configuration file doesn't exist: {file_path}")
+        config = _read_config_file(file_path)
         
-        try:
-            with open(file_path, "r") as f:
-                config = json.load(f)
-            
-            settings = cls()
-            
-            # Apply configuration values
-            for key, value in config.items():
-                if hasattr(settings, key):
-                    setattr(settings, key, value)
-                else:
-                    settings.additional_config[key] = value
-            
-            return settings
-            
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in configuration file: {str(e)}")
+        settings = cls()
+        
+        # Apply configuration values
+        for key, value in config.items():
+            if key in _VALID_NAMES:
+                setattr(settings, key, value)
+            else:
+                settings.additional_config[key] = value
+        
+        return settings
+    
+    def copy(self) -> 'Settings':
+        """Return a copy that does not share mutable state with this one."""
+        return replace(self, additional_config=copy.deepcopy(self.additional_config))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to a dictionary."""
-        return asdict(self)
+        config = {name: getattr(self, name) for name in _SETTINGS_FIELDS}
+        config["additional_config"] = dict(self.additional_config)
+        return config
     
     def to_file(self, file_path: str) -> None:
         """
@@ -135,8 +155,8 @@ class Settings:
             file_path: Path to the configuration file
         """
         try:
-            with open(file_path, "w") as f:
-                json.dump(self.to_dict(), f, indent=2)
+            with open(file_path, "wb") as f:
+                f.write(_json_dumps(self.to_dict()))
         except Exception as e:
             logger.error(f"Failed to save configuration to {file_path}: {str(e)}")
     
@@ -148,12 +168,114 @@ class Settings:
             **kwargs: New settings values
         """
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in _VALID_NAMES:
                 setattr(self, key, value)
             else:
                 self.additional_config[key] = value
 
 
+# Settings field names in declaration order
+_SETTINGS_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(Settings))
+
+# Settings field names for O(1) validation in update()
+_VALID_NAMES = frozenset(_SETTINGS_FIELDS)
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value."""
+    return value.lower() in ("true", "yes", "1")
+
+
+# Environment value converters keyed by field type
+_TYPE_CONVERTERS: Dict[Any, Callable[[str], Any]] = {
+    str: str,
+    Optional[str]: str,
+    int: int,
+    float: float,
+    bool: _parse_bool,
+    Dict[str, Any]: json.loads,
+}
+
+# Precomputed per-field converters and environment variable names, so
+# from_env does not re-resolve type annotations on every call
+_FIELD_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    name: _TYPE_CONVERTERS[field_type]
+    for name, field_type in get_type_hints(Settings).items()
+    if field_type in _TYPE_CONVERTERS
+}
+_ENV_FIELDS: Dict[str, str] = {
+    f"CAICR_{name.upper()}": name for name in _FIELD_CONVERTERS
+}
+
+
+def _read_config_file(file_path: str) -> Dict[str, Any]:
+    """
+    Read a JSON configuration file.
+    
+    Args:
+        file_path: Path to the configuration file
+    
+    Returns:
+        Dict[str, Any]: Parsed configuration
+    
+    Raises:
+        ValueError: If the file doesn't exist or contains invalid JSON
+    """
+    if not os.path.exists(file_path):
+        raise ValueError(f"Configuration file doesn't exist: {file_path}")
+    
+    try:
+        with open(file_path, "rb") as f:
+            return _json_loads(f.read())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in configuration file: {str(e)}")
+
+
+def _env_values(env: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Convert CAICR_ environment variables to settings field values.
+    
+    Args:
+        env: CAICR_ prefixed environment variable items
+    
+    Returns:
+        Dict[str, Any]: Converted values keyed by field name
+    """
+    values = {}
+    
+    # Dispatch each set variable to its field converter
+    for env_name, env_value in env:
+        field_name = _ENV_FIELDS.get(env_name)
+        if field_name is None:
+            continue
+        
+        try:
+            values[field_name] = _FIELD_CONVERTERS[field_name](env_value)
+        except Exception as e:
+            logger.warning(f"Failed to convert environment variable {env_name}: {str(e)}")
+    
+    return values
+
+
+def _env_snapshot() -> Tuple[Tuple[str, str], ...]:
+    """
+    Return the CAICR_ environment variables as a hashable cache key.
+    
+    This is a single pass over os.environ; the prefix check skips
+    unrelated variables without building per-field key strings.
+    """
+    return tuple(sorted(
+        (key, value) for key, value in os.environ.items()
+        if key.startswith("CAICR_")
+    ))
+
+
+@lru_cache(maxsize=1)
+def _env_prototype(cls: type, env: Tuple[Tuple[str, str], ...]) -> Settings:
+    """Parse environment settings once per environment snapshot."""
+    return cls._parse_env(env)
+
+
 def load_settings(
     config_file: Optional[str] = None,
     env_override: bool = True
@@ -161,6 +283,10 @@ def load_settings(
     """
     Load settings from a configuration file and/or environment variables.
     
+    Results are cached by configuration file path and modification time
+    (and by the CAICR_ environment), so repeated calls avoid re-reading
+    the file. Each call returns an independent copy.
+    
     Args:
         config_file: Path to the configuration file (optional)
         env_override: Whether environment variables should override
@@ -169,33 +295,71 @@ def load_settings(
     Returns:
         Settings: Configuration settings
     """
+    try:
+        mtime = os.path.getmtime(config_file) if config_file else 0
+    except OSError:
+        mtime = 0
+    
+    env = _env_snapshot() if env_override else ()
+    settings = _load_settings_cached(config_file, env_override, mtime, env).copy()
+    
+    # Ensure we have an instance ID
+    if not settings.instance_id:
+        settings.instance_id = str(uuid.uuid4())
+    
+    return settings
+
+
+@lru_cache(maxsize=8)
+def _load_settings_cached(
+    config_file: Optional[str],
+    env_override: bool,
+    mtime: float,
+    env: Tuple[Tuple[str, str], ...]
+) -> Settings:
+    """
+    Load settings without an instance ID fallback.
+    
+    File values and environment overrides are merged into a single dict
+    and Settings is constructed once. The mtime argument is only used as
+    a cache key, so a modified configuration file invalidates the entry.
+    """
+    values: Dict[str, Any] = {}
+    additional_config: Dict[str, Any] = {}
+    
     if config_file and os.path.exists(config_file):
         try:
-            settings = Settings.from_file(config_file)
+            config = _read_config_file(config_file)
         except ValueError as e:
             logger.warning(f"Failed to load configuration file: {str(e)}")
-            settings = Settings()
-    else:
-        settings = Settings()
+            config = {}
+        
+        for key, value in config.items():
+            if key == "additional_config":
+                if isinstance(value, dict):
+                    additional_config.update(value)
+                else:
+                    logger.warning(
+                        f"Ignoring additional_config in {config_file}: expected an object, "
+                        f"got {type(value).__name__}"
+                    )
+            elif key in _VALID_NAMES:
+                values[key] = value
+            else:
+                additional_config[key] = value
     
     if env_override:
-        env_settings = Settings.from_env()
-        
-        # Update settings with environment values (if set)
-        for field_name in settings.__annotations__:
-            env_value = getattr(env_settings, field_name)
-            
-            # Only override if the environment variable was actually set
+        # Only variables that are actually set (and non-empty) override
+        for field_name, env_value in _env_values(env).items():
             if field_name == "additional_config":
-                # Merge additional config
-                settings.additional_config.update(env_settings.additional_config)
-            elif env_value is not None and (
-                not isinstance(env_value, (str, bytes)) or len(env_value) > 0
-            ):
-                setattr(settings, field_name, env_value)
-    
-    # Ensure we have an instance ID
-    if not settings.instance_id:
-        settings.instance_id = str(uuid.uuid4())
+                if isinstance(env_value, dict):
+                    additional_config.update(env_value)
+                else:
+                    logger.warning(
+                        "Ignoring CAICR_ADDITIONAL_CONFIG: expected a JSON object, "
+                        f"got {type(env_value).__name__}"
+                    )
+            elif env_value != "":
+                values[field_name] = env_value
     
-    return settings 
\ No newline at end of file
+    return Settings(additional_config=additional_config, **values)
\ No newline at end of file
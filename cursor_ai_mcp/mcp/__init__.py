@@ -1 +1,10 @@
- 
\ No newline at end of file
+"""
+Cursor AI Model Control Protocol (MCP) client.
+"""
+
+from ._loop import install_fast_loop
+
+
+__all__ = [
+    "install_fast_loop",
+]
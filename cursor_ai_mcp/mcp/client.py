@@ -14,10 +14,60 @@ from typing import Dict, Any, Optional, List, Tuple, Union, Callable, Awaitable
 
 from .protocol import MCPConnection, MCPMessage, MCPMessageType, MCPProtocolError
 
+try:
+    from asyncio import timeout as _timeout  # Python 3.11+
+except ImportError:  # pragma: no cover - depends on Python version
+    try:
+        from async_timeout import timeout as _timeout
+    except ImportError:
+        _timeout = None
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
 
+async def _await_with_timeout(future: asyncio.Future, timeout: float) -> Any:
+    """
+    Await a single future with a timeout.
+    
+    Uses a timeout context manager (one timer handle) rather than
+    asyncio.wait_for, which wraps the future and registers extra callbacks
+    on every call. Falls back to wait_for when neither asyncio.timeout nor
+    async_timeout is available.
+    """
+    if _timeout is None:
+        return await asyncio.wait_for(future, timeout=timeout)
+    
+    async with _timeout(timeout):
+        return await future
+
+
+def _make_dispatch(
+    handlers: Tuple[Callable[..., None], ...], description: str
+) -> Callable[..., None]:
+    """
+    Build a single callable that invokes a fixed tuple of handlers.
+    
+    Errors raised by a handler are logged and don't prevent the remaining
+    handlers from running.
+    
+    Args:
+        handlers: Handlers to invoke, in registration order
+        description: Handler kind used in error messages
+    
+    Returns:
+        Callable[..., None]: Dispatch function taking the handler arguments
+    """
+    def dispatch(*args: Any) -> None:
+        for handler in handlers:
+            try:
+                handler(*args)
+            except Exception as e:
+                logger.error(f"Error in {description} handler: {str(e)}")
+    
+    return dispatch
+
+
 class MCPClientError(Exception):
     """Exception raised for errors in the MCP client."""
     pass
@@ -30,6 +80,8 @@ class MCPClient:
     This class provides a high-level interface for connecting to and
     communicating with a Cursor AI instance using the MCP protocol.
     """
+    # Number of pending request slots (must be a power of two)
+    PENDING_SLOTS = 1024
     
     def __init__(
         self,
@@ -44,12 +96,33 @@ class MCPClient:
         self.version = version
         self.connection = None
         self.sequence = 1
-        self.pending_requests = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # In-flight requests are kept in a fixed ring indexed by the low
+        # bits of the sequence number, with a dict for slot collisions
+        self._pending_sequences: List[Optional[int]] = [None] * self.PENDING_SLOTS
+        self._pending_futures: List[Optional[asyncio.Future]] = [None] * self.PENDING_SLOTS
+        self._pending_overflow: Dict[int, asyncio.Future] = {}
         self.operation_handlers = []
         self.state_handlers = []
         self.connection_handlers = []
         self.disconnect_handlers = []
         self.error_handlers = []
+        
+        # Prebuilt callables invoking each handler list (see _make_dispatch)
+        self._operation_dispatch = _make_dispatch((), "operation")
+        self._state_dispatch = _make_dispatch((), "state")
+        self._connect_dispatch = _make_dispatch((), "connection")
+        self._disconnect_dispatch = _make_dispatch((), "disconnect")
+        self._error_dispatch = _make_dispatch((), "error")
+        
+        # Incoming message handlers by message type
+        self._message_handlers = {
+            MCPMessageType.OPERATION: self._handle_operation,
+            MCPMessageType.STATE_RESPONSE: self._handle_state_response,
+            MCPMessageType.OPERATION_RESPONSE: self._handle_operation_response,
+            MCPMessageType.ERROR: self._handle_error,
+        }
     
     async def connect(self) -> bool:
         """
@@ -58,6 +131,9 @@ class MCPClient:
         Returns:
             bool: True if connection successful, False otherwise
         """
+        # Used to allocate request futures without a policy lookup
+        self._loop = asyncio.get_running_loop()
+        
         try:
             reader, writer = await asyncio.open_connection(self.host, self.port)
             
@@ -66,18 +142,15 @@ class MCPClient:
                 writer=writer,
                 instance_id=self.instance_id,
                 version=self.version,
-                on_message=self._handle_message
+                on_message=self._handle_message,
+                on_close=self._fail_pending
             )
             
             success = await self.connection.handshake()
             
             if success:
                 # Notify connection handlers
-                for handler in self.connection_handlers:
-                    try:
-                        handler()
-                    except Exception as e:
-                        logger.error(f"Error in connection handler: {str(e)}")
+                self._connect_dispatch()
             
             return success
             
@@ -92,11 +165,7 @@ class MCPClient:
             self.connection = None
             
             # Notify disconnect handlers
-            for handler in self.disconnect_handlers:
-                try:
-                    handler()
-                except Exception as e:
-                    logger.error(f"Error in disconnect handler: {str(e)}")
+            self._disconnect_dispatch()
     
     def _handle_message(self, message: MCPMessage) -> None:
         """
@@ -105,56 +174,55 @@ class MCPClient:
         This method dispatches messages to the appropriate handlers
         based on the message type.
         """
+        handler = self._message_handlers.get(message.header.message_type)
+        if handler is None:
+            return
+        
         try:
-            if message.header.message_type == MCPMessageType.OPERATION:
-                # Dispatch to operation handlers
-                operation = message.payload.get("operation", {})
-                for handler in self.operation_handlers:
-                    try:
-                        handler(operation)
-                    except Exception as e:
-                        logger.error(f"Error in operation handler: {str(e)}")
-                
-                # Send response
-                self._send_operation_response(message.header.sequence, operation.get("operation_id", 0), True)
-                
-            elif message.header.message_type == MCPMessageType.STATE_RESPONSE:
-                # Dispatch to state handlers
-                state = message.payload.get("state", {})
-                for handler in self.state_handlers:
-                    try:
-                        handler(state)
-                    except Exception as e:
-                        logger.error(f"Error in state handler: {str(e)}")
-                
-                # Complete any pending request
-                self._complete_request(message.header.sequence, state)
-                
-            elif message.header.message_type == MCPMessageType.OPERATION_RESPONSE:
-                # Complete any pending request
-                success = message.payload.get("success", False)
-                operation_id = message.payload.get("operation_id", 0)
-                self._complete_request(message.header.sequence, {"success": success, "operation_id": operation_id})
-                
-            elif message.header.message_type == MCPMessageType.ERROR:
-                # Dispatch to error handlers
-                error = {
-                    "code": message.payload.get("code", 0),
-                    "message": message.payload.get("message", "Unknown error")
-                }
-                
-                for handler in self.error_handlers:
-                    try:
-                        handler(error)
-                    except Exception as e:
-                        logger.error(f"Error in error handler: {str(e)}")
-                
-                # Complete any pending request with an error
-                self._complete_request(message.header.sequence, None, error)
-            
+            handler(message)
         except Exception as e:
             logger.error(f"Error handling message: {str(e)}")
     
+    def _handle_operation(self, message: MCPMessage) -> None:
+        """Handle an OPERATION message."""
+        # Dispatch to operation handlers
+        operation = message.payload.get("operation", {})
+        self._operation_dispatch(operation)
+        
+        # Send response
+        self._send_operation_response(message.header.sequence, operation.get("operation_id", 0), True)
+    
+    def _handle_state_response(self, message: MCPMessage) -> None:
+        """Handle a STATE_RESPONSE message."""
+        # Dispatch to state handlers
+        state = message.payload.get("state", {})
+        self._state_dispatch(state)
+        
+        # Complete any pending request
+        self._complete_request(message.header.sequence, state)
+    
+    def _handle_operation_response(self, message: MCPMessage) -> None:
+        """Handle an OPERATION_RESPONSE message."""
+        # Complete any pending request
+        payload = message.payload
+        success = payload.get("success", False)
+        operation_id = payload.get("operation_id", 0)
+        self._complete_request(message.header.sequence, {"success": success, "operation_id": operation_id})
+    
+    def _handle_error(self, message: MCPMessage) -> None:
+        """Handle an ERROR message."""
+        # Dispatch to error handlers
+        payload = message.payload
+        error = {
+            "code": payload.get("code", 0),
+            "message": payload.get("message", "Unknown error")
+        }
+        
+        self._error_dispatch(error)
+        
+        # Complete any pending request with an error
+        self._complete_request(message.header.sequence, None, error)
+    
     def _send_operation_response(self, sequence: int, operation_id: int, success: bool) -> None:
         """Send an operation response message."""
         if not self.connection:
@@ -163,15 +231,57 @@ class MCPClient:
         
         try:
             response = MCPMessage.create_operation_response(sequence, operation_id, success)
-            asyncio.create_task(self.connection.send_message(response))
+            self.connection.send_message_nowait(response)
         except Exception as e:
             logger.error(f"Error sending operation response: {str(e)}")
     
+    def _next_sequence(self) -> int:
+        """Return the next request sequence number (wraps at 32 bits)."""
+        sequence = self.sequence
+        self.sequence = (sequence + 1) & 0xFFFFFFFF
+        return sequence
+    
+    def _add_pending(self, sequence: int, future: asyncio.Future) -> None:
+        """Track a pending request future by sequence number."""
+        slot = sequence & (self.PENDING_SLOTS - 1)
+        if self._pending_futures[slot] is None:
+            self._pending_sequences[slot] = sequence
+            self._pending_futures[slot] = future
+        else:
+            self._pending_overflow[sequence] = future
+    
+    def _pop_pending(self, sequence: int) -> Optional[asyncio.Future]:
+        """Remove and return the pending request future for a sequence number."""
+        slot = sequence & (self.PENDING_SLOTS - 1)
+        if self._pending_sequences[slot] == sequence:
+            future = self._pending_futures[slot]
+            if future is not None:
+                self._pending_sequences[slot] = None
+                self._pending_futures[slot] = None
+                return future
+        
+        if self._pending_overflow:
+            return self._pending_overflow.pop(sequence, None)
+        return None
+    
+    def _fail_pending(self) -> None:
+        """Fail every pending request after the connection closed."""
+        futures = [f for f in self._pending_futures if f is not None]
+        futures.extend(self._pending_overflow.values())
+        
+        self._pending_sequences[:] = [None] * self.PENDING_SLOTS
+        self._pending_futures[:] = [None] * self.PENDING_SLOTS
+        self._pending_overflow.clear()
+        
+        for future in futures:
+            if not future.done():
+                future.set_exception(MCPClientError("Connection closed"))
+    
     def _complete_request(
         self, sequence: int, result: Any = None, error: Dict[str, Any] = None
     ) -> None:
         """Complete a pending request with a result or error."""
-        future = self.pending_requests.pop(sequence, None)
+        future = self._pop_pending(sequence)
         if future and not future.done():
             if error:
                 future.set_exception(MCPClientError(error["message"]))
@@ -194,22 +304,21 @@ class MCPClient:
         if not self.connection:
             raise MCPClientError("Not connected")
         
-        sequence = self.sequence
-        self.sequence += 1
+        sequence = self._next_sequence()
         
         message = MCPMessage.create_operation(sequence, operation)
-        future = asyncio.Future()
+        future = self._loop.create_future()
         
-        self.pending_requests[sequence] = future
+        self._add_pending(sequence, future)
         
         try:
             await self.connection.send_message(message)
-            return await asyncio.wait_for(future, timeout=30)
+            return await _await_with_timeout(future, 30)
         except asyncio.TimeoutError:
-            self.pending_requests.pop(sequence, None)
+            self._pop_pending(sequence)
             raise MCPClientError("Operation timed out")
         except Exception as e:
-            self.pending_requests.pop(sequence, None)
+            self._pop_pending(sequence)
             raise MCPClientError(f"Failed to send operation: {str(e)}")
     
     async def request_state(self) -> Dict[str, Any]:
@@ -225,40 +334,44 @@ class MCPClient:
         if not self.connection:
             raise MCPClientError("Not connected")
         
-        sequence = self.sequence
-        self.sequence += 1
+        sequence = self._next_sequence()
         
         message = MCPMessage.create_state_request(sequence)
-        future = asyncio.Future()
+        future = self._loop.create_future()
         
-        self.pending_requests[sequence] = future
+        self._add_pending(sequence, future)
         
         try:
             await self.connection.send_message(message)
-            return await asyncio.wait_for(future, timeout=30)
+            return await _await_with_timeout(future, 30)
         except asyncio.TimeoutError:
-            self.pending_requests.pop(sequence, None)
+            self._pop_pending(sequence)
             raise MCPClientError("State request timed out")
         except Exception as e:
-            self.pending_requests.pop(sequence, None)
+            self._pop_pending(sequence)
             raise MCPClientError(f"Failed to request state: {str(e)}")
     
     def on_operation(self, handler: Callable[[Dict[str, Any]], None]) -> None:
         """Register a handler for incoming operations."""
         self.operation_handlers.append(handler)
+        self._operation_dispatch = _make_dispatch(tuple(self.operation_handlers), "operation")
     
     def on_state(self, handler: Callable[[Dict[str, Any]], None]) -> None:
         """Register a handler for state responses."""
         self.state_handlers.append(handler)
+        self._state_dispatch = _make_dispatch(tuple(self.state_handlers), "state")
     
     def on_connect(self, handler: Callable[[], None]) -> None:
         """Register a handler for connection events."""
         self.connection_handlers.append(handler)
+        self._connect_dispatch = _make_dispatch(tuple(self.connection_handlers), "connection")
     
     def on_disconnect(self, handler: Callable[[], None]) -> None:
         """Register a handler for disconnection events."""
         self.disconnect_handlers.append(handler)
+        self._disconnect_dispatch = _make_dispatch(tuple(self.disconnect_handlers), "disconnect")
     
     def on_error(self, handler: Callable[[Dict[str, Any]], None]) -> None:
         """Register a handler for error events."""
-        self.error_handlers.append(handler) 
\ No newline at end of file
+        self.error_handlers.append(handler)
+        self._error_dispatch = _make_dispatch(tuple(self.error_handlers), "error") 
\ No newline at end of file
@@ -18,10 +18,59 @@ import hmac
 import hashlib
 import base64
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional dependency
+    ormsgpack = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
 
+if orjson is not None:
+    def _json_dumps(obj: Any) -> bytes:
+        # Non-str keys are stringified, as json.dumps does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    
+    def _json_loads(data: bytes) -> Any:
+        # str() rather than data.decode() so memoryview slices work too
+        return json.loads(str(data, 'utf-8'))
+
+# Non-str map keys are allowed both ways, so any payload the JSON codec
+# accepts also survives the msgpack codec
+if ormsgpack is not None:
+    def _msgpack_dumps(obj: Any) -> bytes:
+        return ormsgpack.packb(obj, option=ormsgpack.OPT_NON_STR_KEYS)
+    
+    def _msgpack_loads(data: bytes) -> Any:
+        return ormsgpack.unpackb(data, option=ormsgpack.OPT_NON_STR_KEYS)
+elif msgpack is not None:
+    _msgpack_dumps = msgpack.packb
+    
+    def _msgpack_loads(data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+else:
+    _msgpack_dumps = _msgpack_loads = None
+
+# Capability advertised in the handshake when msgpack payloads are supported
+MSGPACK_CAPABILITY = "msgpack"
+
+
 class MCPMessageType(IntEnum):
     """Enum defining MCP message types."""
     HANDSHAKE = 1
@@ -35,6 +84,15 @@ class MCPMessageType(IntEnum):
     HEARTBEAT_RESPONSE = 9
 
 
+# Wire value to message type, avoiding IntEnum construction per frame
+_MSG_TYPE_MAP = {int(m): m for m in MCPMessageType}
+
+# Message type values compared on hot paths
+_MT_HANDSHAKE = MCPMessageType.HANDSHAKE.value
+_MT_HANDSHAKE_RESPONSE = MCPMessageType.HANDSHAKE_RESPONSE.value
+_MT_HEARTBEAT = MCPMessageType.HEARTBEAT.value
+
+
 class MCPProtocolError(Exception):
     """Exception raised for errors in the MCP protocol."""
     pass
@@ -42,6 +100,8 @@ class MCPProtocolError(Exception):
 
 class MCPMessageHeader:
     """MCP message header structure."""
+    __slots__ = ("message_type", "length", "sequence", "timestamp")
+    
     FORMAT = "!BBHIIQ"  # Network byte order, magic(2), type(2), length(4), seq(8), timestamp(8)
     MAGIC = (0x4D, 0x43)  # 'MC' in ASCII
     SIZE = struct.calcsize(FORMAT)
@@ -56,32 +116,30 @@ class MCPMessageHeader:
         self.message_type = message_type
         self.length = length
         self.sequence = sequence
-        self.timestamp = timestamp or int(time.time() * 1_000_000)  # microseconds
+        self.timestamp = timestamp or time.time_ns() // 1000  # microseconds
     
     @classmethod
-    def unpack(cls, header_bytes: bytes) -> 'MCPMessageHeader':
-        """Unpack a header from bytes."""
-        if len(header_bytes) < cls.SIZE:
-            raise MCPProtocolError(f"Header too short: {len(header_bytes)} < {cls.SIZE}")
+    def unpack(cls, header_bytes: bytes, offset: int = 0) -> 'MCPMessageHeader':
+        """Unpack a header from bytes, starting at the given offset."""
+        if len(header_bytes) - offset < cls.SIZE:
+            raise MCPProtocolError(f"Header too short: {len(header_bytes) - offset} < {cls.SIZE}")
         
-        magic1, magic2, message_type, length, sequence, timestamp = struct.unpack(
-            cls.FORMAT, header_bytes[:cls.SIZE]
+        magic1, magic2, message_type, length, sequence, timestamp = _HDR_UNPACK_FROM(
+            header_bytes, offset
         )
         
         if (magic1, magic2) != cls.MAGIC:
             raise MCPProtocolError(f"Invalid magic bytes: {magic1:02x}{magic2:02x}")
         
-        try:
-            message_type_enum = MCPMessageType(message_type)
-        except ValueError:
+        message_type_enum = _MSG_TYPE_MAP.get(message_type)
+        if message_type_enum is None:
             raise MCPProtocolError(f"Unknown message type: {message_type}")
         
         return cls(message_type_enum, length, sequence, timestamp)
     
     def pack(self) -> bytes:
         """Pack the header into bytes."""
-        return struct.pack(
-            self.FORMAT,
+        return _HDR_STRUCT.pack(
             self.MAGIC[0],
             self.MAGIC[1],
             self.message_type.value,
@@ -91,8 +149,57 @@ class MCPMessageHeader:
         )
 
 
+# Precompiled header struct
+_HDR_STRUCT = struct.Struct(MCPMessageHeader.FORMAT)
+_HDR_UNPACK_FROM = _HDR_STRUCT.unpack_from
+
+# Pre-encoded payload for messages without payload fields (heartbeats,
+# heartbeat responses, state requests)
+_EMPTY_PAYLOAD = b"{}"
+
+
+class _PayloadCodec:
+    """Payload encoding negotiated for a connection."""
+    
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes], Any]
+    ):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+        self.empty_payload = dumps({})
+
+
+# JSON is always available and is used for the handshake itself
+_JSON_CODEC = _PayloadCodec("json", _json_dumps, _json_loads)
+_MSGPACK_CODEC = (
+    _PayloadCodec(MSGPACK_CAPABILITY, _msgpack_dumps, _msgpack_loads)
+    if _msgpack_dumps is not None else None
+)
+
+
+def _pack_empty_frame(
+    message_type: MCPMessageType,
+    sequence: int,
+    empty_payload: bytes = _EMPTY_PAYLOAD
+) -> bytes:
+    """Pack a complete frame with an empty payload, skipping payload encoding."""
+    return _HDR_STRUCT.pack(
+        MCPMessageHeader.MAGIC[0],
+        MCPMessageHeader.MAGIC[1],
+        message_type.value,
+        len(empty_payload),
+        sequence,
+        time.time_ns() // 1000
+    ) + empty_payload
+
+
 class MCPMessage:
     """MCP protocol message."""
+    __slots__ = ("header", "payload")
     
     def __init__(
         self,
@@ -119,18 +226,43 @@ class MCPMessage:
         # Read the payload
         payload_bytes = await reader.readexactly(header.length)
         
+        return cls.from_payload(header, payload_bytes)
+    
+    @classmethod
+    def from_payload(
+        cls,
+        header: MCPMessageHeader,
+        payload_bytes: bytes,
+        codec: _PayloadCodec = _JSON_CODEC
+    ) -> 'MCPMessage':
+        """Build a message from an unpacked header and its payload bytes."""
         try:
-            payload = json.loads(payload_bytes.decode('utf-8'))
-        except json.JSONDecodeError:
-            raise MCPProtocolError(f"Invalid JSON payload: {payload_bytes}")
+            payload = codec.loads(payload_bytes)
+        except (ValueError, UnicodeDecodeError):
+            raise MCPProtocolError(f"Invalid {codec.name} payload: {bytes(payload_bytes)}")
         
         return cls(header.message_type, header.sequence, payload, header.timestamp)
     
-    def pack(self) -> bytes:
-        """Pack the message into bytes."""
-        payload_bytes = json.dumps(self.payload).encode('utf-8')
+    def encode_payload(self, codec: _PayloadCodec = _JSON_CODEC) -> bytes:
+        """
+        Encode the payload and record its length in the header.
+        
+        Raises:
+            MCPProtocolError: If the payload cannot be encoded
+        """
+        payload = self.payload
+        try:
+            payload_bytes = codec.dumps(payload) if payload else codec.empty_payload
+        except (TypeError, ValueError, OverflowError) as e:
+            raise MCPProtocolError(f"Cannot encode {codec.name} payload: {str(e)}") from e
         self.header.length = len(payload_bytes)
         
+        return payload_bytes
+    
+    def pack(self, codec: _PayloadCodec = _JSON_CODEC) -> bytes:
+        """Pack the message into bytes."""
+        payload_bytes = self.encode_payload(codec)
+        
         return self.header.pack() + payload_bytes
     
     def to_dict(self) -> Dict[str, Any]:
@@ -145,13 +277,17 @@ class MCPMessage:
     @classmethod
     def create_handshake(cls, instance_id: str, version: str) -> 'MCPMessage':
         """Create a handshake message."""
+        capabilities = ["undo", "redo", "sync", "reconciliation"]
+        if _MSGPACK_CODEC is not None:
+            capabilities.append(MSGPACK_CAPABILITY)
+        
         return cls(
             message_type=MCPMessageType.HANDSHAKE,
             sequence=0,
             payload={
                 "instance_id": instance_id,
                 "version": version,
-                "capabilities": ["undo", "redo", "sync", "reconciliation"]
+                "capabilities": capabilities
             }
         )
     
@@ -218,6 +354,22 @@ class MCPMessage:
             }
         )
     
+    @staticmethod
+    def pack_heartbeat(sequence: int, codec: _PayloadCodec = _JSON_CODEC) -> bytes:
+        """Pack a heartbeat frame directly, without an MCPMessage."""
+        return _pack_empty_frame(
+            MCPMessageType.HEARTBEAT, sequence, codec.empty_payload
+        )
+    
+    @staticmethod
+    def pack_heartbeat_response(
+        sequence: int, codec: _PayloadCodec = _JSON_CODEC
+    ) -> bytes:
+        """Pack a heartbeat response frame directly, without an MCPMessage."""
+        return _pack_empty_frame(
+            MCPMessageType.HEARTBEAT_RESPONSE, sequence, codec.empty_payload
+        )
+    
     @classmethod
     def create_heartbeat(cls, sequence: int) -> 'MCPMessage':
         """Create a heartbeat message."""
@@ -245,6 +397,23 @@ class MCPConnection:
     including message serialization, deserialization, and connection
     management.
     """
+    # Maximum number of queued messages written per write/drain
+    MAX_SEND_BATCH = 64
+    
+    # Maximum number of messages waiting for the sender; send_message
+    # blocks once it is reached, so a stalled peer pushes back on callers
+    MAX_SEND_QUEUE = 1024
+    
+    # Bytes requested per read in the receiver loop
+    READ_CHUNK_SIZE = 65536
+    
+    # Transport write buffer limits (bytes)
+    WRITE_BUFFER_HIGH = 65536
+    WRITE_BUFFER_LOW = 16384
+    
+    # Seconds between heartbeats, and of silence before giving up
+    HEARTBEAT_INTERVAL = 30
+    RECEIVE_TIMEOUT = 90
     
     def __init__(
         self,
@@ -252,35 +421,150 @@ class MCPConnection:
         writer: asyncio.StreamWriter,
         instance_id: str,
         version: str,
-        on_message: Callable[[MCPMessage], None] = None
+        on_message: Callable[[MCPMessage], None] = None,
+        on_close: Callable[[], None] = None
     ):
         self.reader = reader
         self.writer = writer
         self.instance_id = instance_id
         self.version = version
         self.on_message = on_message
+        self.on_close = on_close
         self.sequence = 1
         self.connected = False
         self.remote_instance_id = None
         self.remote_capabilities = []
         self.last_received = time.time()
-        self.heartbeat_task = None
+        self.last_sent = time.monotonic()
         self.receiver_task = None
+        self.sender_task = None
+        self._send_queue = asyncio.Queue(maxsize=self.MAX_SEND_QUEUE)
+        self._heartbeat_handle: Optional[asyncio.TimerHandle] = None
+        self._close_task: Optional[asyncio.Task] = None
+        
+        # Payload encoding; switched to msgpack if both peers support it
+        self.codec = _JSON_CODEC
     
     async def send_message(self, message: MCPMessage) -> None:
-        """Send a message over the connection."""
-        if not self.connected and message.header.message_type != MCPMessageType.HANDSHAKE:
+        """
+        Send a message over the connection.
+        
+        Once the handshake is complete, messages are queued and written by
+        the sender task, which coalesces bursts into a single write and
+        drain. The handshake itself is written directly.
+        
+        The payload is encoded before queueing, so a payload that cannot
+        be encoded raises MCPProtocolError here instead of failing in the
+        sender task. While the queue is full this waits for the sender to
+        catch up.
+        """
+        if message.header.message_type == _MT_HANDSHAKE:
+            await self._write_messages([(message.header, message.encode_payload(self.codec))])
+            return
+        
+        if not self.connected:
+            raise MCPProtocolError("Cannot send messages before handshake is complete")
+        
+        await self._send_queue.put((message.header, message.encode_payload(self.codec)))
+        
+        # The connection may have closed while waiting for queue space
+        if not self.connected:
+            raise MCPProtocolError("Connection closed")
+    
+    def send_message_nowait(self, message: MCPMessage) -> None:
+        """
+        Queue a message for sending without awaiting.
+        
+        For use from synchronous code running on the event loop, where
+        spawning a task just to call send_message would be wasteful.
+        
+        Raises:
+            MCPProtocolError: If the payload cannot be encoded or the send
+                queue is full
+        """
+        if not self.connected:
             raise MCPProtocolError("Cannot send messages before handshake is complete")
         
         try:
-            data = message.pack()
-            self.writer.write(data)
-            await self.writer.drain()
-            logger.debug(f"Sent {message.header.message_type.name} message, seq={message.header.sequence}")
+            self._send_queue.put_nowait((message.header, message.encode_payload(self.codec)))
+        except asyncio.QueueFull:
+            raise MCPProtocolError("Send queue is full")
+    
+    async def _write_messages(
+        self,
+        messages: List[Union[Tuple[MCPMessageHeader, bytes], bytes]],
+        timestamp: Optional[int] = None
+    ) -> None:
+        """
+        Write a batch of messages.
+        
+        The writer is only drained when the transport's buffer exceeds
+        WRITE_BUFFER_HIGH; otherwise the kernel has room and waiting on
+        drain() would just cost a loop round-trip.
+        
+        Args:
+            messages: (header, encoded payload) pairs or pre-packed
+                frames to write
+            timestamp: If given, stamped on every message in the batch
+                instead of each keeping its own clock read
+        """
+        try:
+            writer = self.writer
+            transport = writer.transport
+            if transport.is_closing():
+                raise ConnectionResetError("Connection lost")
+            
+            # Queued items are frames packed ahead of time or headers with
+            # their already-encoded payloads, written as separate parts
+            parts = []
+            for message in messages:
+                if message.__class__ is bytes:
+                    parts.append(message)
+                else:
+                    header, payload_bytes = message
+                    if timestamp is not None:
+                        header.timestamp = timestamp
+                    parts.append(header.pack())
+                    parts.append(payload_bytes)
+            writer.writelines(parts)
+            self.last_sent = time.monotonic()
+            
+            # Only yield to the loop when the transport is actually backed up
+            if transport.get_write_buffer_size() > self.WRITE_BUFFER_HIGH:
+                await writer.drain()
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                for message in messages:
+                    header = (
+                        MCPMessageHeader.unpack(message)
+                        if message.__class__ is bytes else message[0]
+                    )
+                    logger.debug(f"Sent {header.message_type.name} message, seq={header.sequence}")
         except (ConnectionError, asyncio.CancelledError) as e:
             logger.error(f"Error sending message: {str(e)}")
             raise
     
+    async def _sender_loop(self) -> None:
+        """Write queued messages, coalescing up to MAX_SEND_BATCH per write."""
+        queue = self._send_queue
+        
+        try:
+            while self.connected:
+                batch = [await queue.get()]
+                
+                # Drain whatever else is already queued without waiting
+                while len(batch) < self.MAX_SEND_BATCH and not queue.empty():
+                    batch.append(queue.get_nowait())
+                
+                # One clock read for the whole batch
+                await self._write_messages(batch, time.time_ns() // 1000)
+                
+        except asyncio.CancelledError:
+            logger.debug("Sender loop cancelled")
+        except Exception as e:
+            logger.error(f"Error in sender loop: {str(e)}")
+            await self.close()
+    
     async def receive_message(self) -> MCPMessage:
         """Receive a message from the connection."""
         try:
@@ -300,7 +584,7 @@ class MCPConnection:
             await self.send_message(handshake_msg)
             response = await self.receive_message()
             
-            if response.header.message_type != MCPMessageType.HANDSHAKE_RESPONSE:
+            if response.header.message_type != _MT_HANDSHAKE_RESPONSE:
                 logger.error(f"Expected HANDSHAKE_RESPONSE, got {response.header.message_type.name}")
                 return False
             
@@ -308,12 +592,25 @@ class MCPConnection:
             self.remote_capabilities = response.payload.get("capabilities", [])
             self.connected = True
             
+            # Everything after the handshake uses msgpack if both sides have it
+            if _MSGPACK_CODEC is not None and MSGPACK_CAPABILITY in self.remote_capabilities:
+                self.codec = _MSGPACK_CODEC
+            
             logger.info(f"Handshake successful with instance {self.remote_instance_id}")
             logger.debug(f"Remote capabilities: {self.remote_capabilities}")
+            logger.debug(f"Using {self.codec.name} payload encoding")
+            
+            self.writer.transport.set_write_buffer_limits(
+                high=self.WRITE_BUFFER_HIGH, low=self.WRITE_BUFFER_LOW
+            )
             
-            # Start the heartbeat and receiver tasks
-            self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
-            self.receiver_task = asyncio.create_task(self._receiver_loop())
+            # Start the sender and receiver tasks and arm the heartbeat timer
+            loop = asyncio.get_running_loop()
+            self.sender_task = loop.create_task(self._sender_loop())
+            self.receiver_task = loop.create_task(self._receiver_loop())
+            self._heartbeat_handle = loop.call_later(
+                self.HEARTBEAT_INTERVAL, self._heartbeat_tick
+            )
             
             return True
             
@@ -321,48 +618,136 @@ class MCPConnection:
             logger.error(f"Handshake failed: {str(e)}")
             return False
     
-    async def _heartbeat_loop(self) -> None:
-        """Send heartbeats periodically to keep the connection alive."""
+    def _heartbeat_tick(self) -> None:
+        """
+        Send a heartbeat to keep the connection alive and re-arm the timer.
+        
+        Runs as a loop timer callback rather than a sleeping task. The
+        heartbeat is skipped if something else was sent within the last
+        HEARTBEAT_INTERVAL seconds.
+        """
+        self._heartbeat_handle = None
+        if not self.connected:
+            return
+        
+        loop = asyncio.get_running_loop()
+        delay = self.HEARTBEAT_INTERVAL
+        
         try:
-            while self.connected:
-                # Send a heartbeat every 30 seconds
-                await asyncio.sleep(30)
-                
-                # Check if we've received anything recently
-                if time.time() - self.last_received > 90:
-                    logger.warning("No messages received for 90 seconds, closing connection")
-                    await self.close()
-                    break
-                
-                # Send a heartbeat
-                heartbeat = MCPMessage.create_heartbeat(self.sequence)
-                self.sequence += 1
-                await self.send_message(heartbeat)
+            # Check if we've received anything recently
+            if time.time() - self.last_received > self.RECEIVE_TIMEOUT:
+                logger.warning(
+                    f"No messages received for {self.RECEIVE_TIMEOUT} seconds, closing connection"
+                )
+                self._close_task = loop.create_task(self.close())
+                return
+            
+            idle = time.monotonic() - self.last_sent
+            if idle >= self.HEARTBEAT_INTERVAL:
+                heartbeat = MCPMessage.pack_heartbeat(self.sequence, self.codec)
+                try:
+                    self._send_queue.put_nowait(heartbeat)
+                    self.sequence += 1
+                except asyncio.QueueFull:
+                    # Messages are already waiting to go out
+                    pass
+            else:
+                # Fire again once the connection has been idle long enough
+                delay -= idle
                 
-        except asyncio.CancelledError:
-            logger.debug("Heartbeat loop cancelled")
         except Exception as e:
-            logger.error(f"Error in heartbeat loop: {str(e)}")
-            await self.close()
+            logger.error(f"Error in heartbeat timer: {str(e)}")
+            self._close_task = loop.create_task(self.close())
+            return
+        
+        self._heartbeat_handle = loop.call_later(delay, self._heartbeat_tick)
     
     async def _receiver_loop(self) -> None:
-        """Receive and process messages in a loop."""
+        """
+        Receive and process messages in a loop.
+        
+        Data is read in chunks and every complete frame in the buffer is
+        parsed and dispatched before awaiting again, instead of awaiting
+        the header and payload of each message separately. Headers are
+        unpacked into locals; heartbeats are answered straight from the
+        header fields, and only frames passed to on_message are built
+        into MCPMessage objects, decoding straight from a view of the
+        buffer so the payload is never copied out of it.
+        """
+        reader = self.reader
+        codec = self.codec
+        send_queue = self._send_queue
+        buffer = bytearray()
+        header_size = MCPMessageHeader.SIZE
+        magic = MCPMessageHeader.MAGIC
+        
         try:
             while self.connected:
-                message = await self.receive_message()
+                data = await reader.read(self.READ_CHUNK_SIZE)
+                if not data:
+                    raise asyncio.IncompleteReadError(bytes(buffer), None)
                 
-                # Handle heartbeats automatically
-                if message.header.message_type == MCPMessageType.HEARTBEAT:
-                    response = MCPMessage.create_heartbeat_response(message.header.sequence)
-                    await self.send_message(response)
-                    continue
+                buffer += data
+                self.last_received = time.time()
+                debug = logger.isEnabledFor(logging.DEBUG)
                 
-                # Dispatch other messages to the handler
-                if self.on_message:
-                    try:
-                        self.on_message(message)
-                    except Exception as e:
-                        logger.error(f"Error in message handler: {str(e)}")
+                # Consume all complete frames
+                offset = 0
+                view = None
+                while len(buffer) - offset >= header_size:
+                    magic1, magic2, message_type, length, sequence, timestamp = _HDR_UNPACK_FROM(
+                        buffer, offset
+                    )
+                    if (magic1, magic2) != magic:
+                        raise MCPProtocolError(f"Invalid magic bytes: {magic1:02x}{magic2:02x}")
+                    
+                    end = offset + header_size + length
+                    if len(buffer) < end:
+                        break
+                    
+                    payload_start = offset + header_size
+                    offset = end
+                    
+                    # Handle heartbeats automatically
+                    if message_type == _MT_HEARTBEAT:
+                        if debug:
+                            logger.debug(f"Received HEARTBEAT message, seq={sequence}")
+                        try:
+                            send_queue.put_nowait(
+                                MCPMessage.pack_heartbeat_response(sequence, codec)
+                            )
+                        except asyncio.QueueFull:
+                            # The queued messages show the peer we're alive
+                            logger.debug(f"Send queue full, skipping HEARTBEAT_RESPONSE, seq={sequence}")
+                        continue
+                    
+                    message_type_enum = _MSG_TYPE_MAP.get(message_type)
+                    if message_type_enum is None:
+                        raise MCPProtocolError(f"Unknown message type: {message_type}")
+                    
+                    if debug:
+                        logger.debug(f"Received {message_type_enum.name} message, seq={sequence}")
+                    
+                    # Dispatch other messages to the handler
+                    on_message = self.on_message
+                    if on_message:
+                        if view is None:
+                            view = memoryview(buffer)
+                        message = MCPMessage.from_payload(
+                            MCPMessageHeader(message_type_enum, length, sequence, timestamp),
+                            view[payload_start:end],
+                            codec
+                        )
+                        try:
+                            on_message(message)
+                        except Exception as e:
+                            logger.error(f"Error in message handler: {str(e)}")
+                
+                # The buffer can't be resized while a view of it exists
+                if view is not None:
+                    view.release()
+                if offset:
+                    del buffer[:offset]
                 
         except asyncio.CancelledError:
             logger.debug("Receiver loop cancelled")
@@ -374,20 +759,36 @@ class MCPConnection:
         """Close the connection."""
         self.connected = False
         
-        # Cancel tasks
-        if self.heartbeat_task:
-            self.heartbeat_task.cancel()
-            try:
-                await self.heartbeat_task
-            except asyncio.CancelledError:
-                pass
+        if self._heartbeat_handle is not None:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+        
+        # Cancel tasks (a task closing the connection can't await itself)
+        current_task = asyncio.current_task()
+        
+        for task in (self.sender_task, self.receiver_task):
+            if task and task is not current_task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        
+        # Drop unsent messages. Each get wakes one send_message blocked on
+        # a full queue, which may refill the slot, so yield between gets
+        # until no waiter is left
+        queue = self._send_queue
+        while not queue.empty():
+            queue.get_nowait()
+            await asyncio.sleep(0)
         
-        if self.receiver_task:
-            self.receiver_task.cancel()
+        # Let the owner fail requests that will now never be answered
+        on_close, self.on_close = self.on_close, None
+        if on_close:
             try:
-                await self.receiver_task
-            except asyncio.CancelledError:
-                pass
+                on_close()
+            except Exception as e:
+                logger.error(f"Error in close handler: {str(e)}")
         
         # Close the writer
         try:
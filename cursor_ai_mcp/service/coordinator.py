@@ -12,19 +12,57 @@ import threading
 import uuid
 import time
 import os
+import sys
+import random
 from typing import Dict, Any, Optional, List, Tuple, Union, Callable, Awaitable
 
 from ..binding.caicr_binding import CAICRBinding, CAICRBindingError, CAICRStatus
-from ..binding.caicr_types import CAICRInstancePtr, CAICROperationType
+from ..binding.caicr_types import CAICRInstancePtr, CAICROperationType, Operation
 from ..mcp.client import MCPClient, MCPClientError
 from ..config.settings import Settings
-from ..telemetry.logging import setup_logger
+from ..telemetry.logging import setup_logger, stop_logging
 from ..telemetry.metrics import MetricsCollector
+from ..utils.fs import ensure_dir
 from ..utils.security import generate_secure_id
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# MCP type name for each CAICR operation type ("CAICR_OP_INSERT" -> "insert")
+_OP_TYPE_NAMES = {
+    op_type: op_type.name.lower().replace("caicr_op_", "")
+    for op_type in CAICROperationType
+}
+
+
+# CAICR operation type for each MCP type name (matched case-insensitively)
+_OP_TYPE_MAP = {
+    "insert": CAICROperationType.CAICR_OP_INSERT,
+    "delete": CAICROperationType.CAICR_OP_DELETE,
+    "replace": CAICROperationType.CAICR_OP_REPLACE,
+    "meta": CAICROperationType.CAICR_OP_META_CHANGE,
+    "resource": CAICROperationType.CAICR_OP_RESOURCE,
+}
+
+
+def _to_mcp_operation(operation: Operation) -> Dict[str, Any]:
+    """
+    Convert a CAICR operation to an MCP operation dictionary.
+    
+    The dict is built directly from the slotted Operation, since the
+    payload is sent as a JSON object anyway.
+    """
+    return {
+        "id": operation.operation_id,
+        "type": _OP_TYPE_NAMES[operation.type],
+        "file_path": operation.file_path,
+        "line": operation.line_number,
+        "column": operation.column_number,
+        "content": operation.content,
+        "instance_id": operation.instance_id,
+        "timestamp": operation.timestamp_ns // 1000  # ns to μs
+    }
+
 
 class CoordinatorError(Exception):
     """Exception raised for errors in the coordinator service."""
@@ -56,43 +94,67 @@ class CoordinationService:
         self.loop = None
         self.thread = None
         self.metrics = MetricsCollector(self.instance_id)
+        self._reconnect_attempt = 0
+        self._stop_event: Optional[asyncio.Event] = None
     
-    def _operation_callback(self, operations: List[Dict[str, Any]]) -> None:
+    def _operation_callback(self, operations: List[Operation]) -> None:
         """
         Callback function for CAICR operations.
         
         This function is called when operations are received from other
         CAICR instances and need to be forwarded to the Cursor AI instance.
         """
-        if not self.mcp_client:
+        mcp_client = self.mcp_client
+        if not mcp_client:
             logger.warning("Cannot forward operations: MCP client not initialized")
             return
         
-        for operation in operations:
-            try:
-                # Convert CAICR operation to MCP operation
-                mcp_operation = {
-                    "id": operation["operation_id"],
-                    "type": operation["type"].name.lower().replace("caicr_op_", ""),
-                    "file_path": operation["file_path"],
-                    "line": operation["line_number"],
-                    "column": operation["column_number"],
-                    "content": operation["content"],
-                    "instance_id": operation["instance_id"],
-                    "timestamp": operation["timestamp_ns"] // 1000  # ns to μs
-                }
-                
-                # Forward to MCP client in the event loop
-                asyncio.run_coroutine_threadsafe(
-                    self.mcp_client.send_operation(mcp_operation),
-                    self.loop
-                )
-                
-                # Update metrics
-                self.metrics.record_operation_forwarded()
-                
-            except Exception as e:
-                logger.error(f"Error forwarding operation: {str(e)}")
+        # Convert CAICR operations to MCP operations
+        try:
+            mcp_operations = [_to_mcp_operation(operation) for operation in operations]
+        except Exception:
+            # Fall back to converting one by one, skipping the bad ones
+            mcp_operations = []
+            for operation in operations:
+                try:
+                    mcp_operations.append(_to_mcp_operation(operation))
+                except Exception as e:
+                    logger.error("Error forwarding operation: %s", e)
+        
+        if not mcp_operations:
+            return
+        
+        try:
+            # Forward the whole batch to the MCP client with a single
+            # cross-thread handoff to the event loop
+            asyncio.run_coroutine_threadsafe(
+                self._forward_operations(mcp_client, mcp_operations),
+                self.loop
+            )
+            
+            # Update metrics
+            self.metrics.record_operations_forwarded(len(mcp_operations))
+            
+        except Exception as e:
+            logger.error("Error forwarding operations: %s", e)
+    
+    async def _forward_operations(
+        self, mcp_client: MCPClient, mcp_operations: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Send a batch of operations to the Cursor AI instance.
+        
+        Operations are sent concurrently so a batch costs one round-trip
+        rather than one per operation.
+        """
+        results = await asyncio.gather(
+            *[mcp_client.send_operation(op) for op in mcp_operations],
+            return_exceptions=True
+        )
+        
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error forwarding operation: %s", result)
     
     def _mcp_operation_handler(self, operation: Dict[str, Any]) -> None:
         """
@@ -106,30 +168,24 @@ class CoordinationService:
             return
         
         try:
-            # Convert MCP operation to CAICR operation
-            op_type_str = operation.get("type", "").upper()
-            if op_type_str == "INSERT":
-                op_type = CAICROperationType.CAICR_OP_INSERT
-            elif op_type_str == "DELETE":
-                op_type = CAICROperationType.CAICR_OP_DELETE
-            elif op_type_str == "REPLACE":
-                op_type = CAICROperationType.CAICR_OP_REPLACE
-            elif op_type_str == "META":
-                op_type = CAICROperationType.CAICR_OP_META_CHANGE
-            elif op_type_str == "RESOURCE":
-                op_type = CAICROperationType.CAICR_OP_RESOURCE
-            else:
-                logger.warning(f"Unknown operation type: {op_type_str}")
-                return
+            # Convert MCP operation to CAICR operation; type names are
+            # normally lowercase already, so only fold case on a miss
+            op_type_str = operation.get("type", "")
+            op_type = _OP_TYPE_MAP.get(op_type_str)
+            if op_type is None:
+                op_type = _OP_TYPE_MAP.get(op_type_str.lower())
+                if op_type is None:
+                    logger.warning("Unknown operation type: %s", op_type_str.upper())
+                    return
             
-            caicr_operation = {
-                "type": op_type,
-                "file_path": operation.get("file_path", ""),
-                "line_number": operation.get("line", 0),
-                "column_number": operation.get("column", 0),
-                "content": operation.get("content", ""),
-                "instance_id": self.instance_id
-            }
+            caicr_operation = Operation(
+                op_type,
+                operation.get("file_path", ""),
+                operation.get("line", 0),
+                operation.get("column", 0),
+                operation.get("content", ""),
+                instance_id=self.instance_id
+            )
             
             # Submit to CAICR
             self.caicr_binding.submit_operation(self.caicr_instance, caicr_operation)
@@ -138,11 +194,12 @@ class CoordinationService:
             self.metrics.record_operation_received()
             
         except Exception as e:
-            logger.error(f"Error submitting operation to CAICR: {str(e)}")
+            logger.error("Error submitting operation to CAICR: %s", e)
     
     def _mcp_connect_handler(self) -> None:
         """Handler for MCP connection events."""
         logger.info(f"Connected to Cursor AI instance")
+        self._reconnect_attempt = 0
         self.metrics.record_connection()
     
     def _mcp_disconnect_handler(self) -> None:
@@ -151,19 +208,35 @@ class CoordinationService:
         self.metrics.record_disconnection()
         
         # Attempt to reconnect after a delay
-        if self.running and self.loop:
-            asyncio.run_coroutine_threadsafe(
-                self._reconnect(),
-                self.loop
-            )
+        loop = self.loop
+        if self.running and loop:
+            try:
+                on_loop = asyncio.get_running_loop() is loop
+            except RuntimeError:
+                on_loop = False
+            
+            # The MCP client calls this from the service loop, so the task can
+            # normally be created directly rather than via a thread-safe handoff
+            if on_loop:
+                loop.create_task(self._reconnect())
+            else:
+                loop.call_soon_threadsafe(self._start_reconnect)
+    
+    def _start_reconnect(self) -> None:
+        """Start a reconnect task; must be called on the service loop."""
+        if self.running:
+            self.loop.create_task(self._reconnect())
     
     def _mcp_error_handler(self, error: Dict[str, Any]) -> None:
         """Handler for MCP error events."""
-        logger.error(f"MCP error: {error.get('message', 'Unknown error')}")
+        logger.error("MCP error: %s", error.get("message", "Unknown error"))
         self.metrics.record_error(error.get("code", 0), error.get("message", ""))
     
     async def _asyncio_main(self) -> None:
         """Main asyncio function for the service thread."""
+        # Set by stop() from another thread via call_soon_threadsafe
+        self._stop_event = asyncio.Event()
+        
         try:
             # Initialize MCP client
             self.mcp_client = MCPClient(
@@ -183,9 +256,9 @@ class CoordinationService:
                 logger.error("Failed to connect to Cursor AI")
                 return
             
-            # Main service loop
-            while self.running:
-                await asyncio.sleep(1)
+            # Wait until the service is stopped
+            if self.running:
+                await self._stop_event.wait()
             
         except asyncio.CancelledError:
             logger.info("Asyncio main task cancelled")
@@ -197,27 +270,45 @@ class CoordinationService:
                 await self.mcp_client.disconnect()
                 self.mcp_client = None
     
-    async def _reconnect(self) -> None:
-        """Attempt to reconnect to the Cursor AI instance."""
-        if not self.mcp_client or not self.running:
-            return
-        
-        logger.info("Attempting to reconnect to Cursor AI...")
+    def _reconnect_delay(self) -> float:
+        """
+        Get the delay before the next reconnect attempt.
         
-        # Wait before reconnecting
-        await asyncio.sleep(5)
+        Uses exponential backoff with full jitter: a random delay between
+        zero and reconnect_initial_delay * 2**attempt, capped at
+        max_reconnect_delay, so instances that lost the connection at the
+        same moment don't all retry in lockstep.
+        """
+        # Bound the exponent; the cap is reached long before this anyway
+        attempt = min(self._reconnect_attempt, 32)
+        self._reconnect_attempt += 1
         
-        try:
-            if await self.mcp_client.connect():
-                logger.info("Reconnected to Cursor AI")
-            else:
+        ceiling = min(
+            self.settings.max_reconnect_delay,
+            self.settings.reconnect_initial_delay * (2 ** attempt)
+        )
+        return random.uniform(0, ceiling)
+    
+    async def _reconnect(self) -> None:
+        """Attempt to reconnect to the Cursor AI instance until it succeeds."""
+        while self.mcp_client and self.running:
+            delay = self._reconnect_delay()
+            logger.info(f"Attempting to reconnect to Cursor AI in {delay:.1f}s...")
+            
+            # Wait before reconnecting
+            await asyncio.sleep(delay)
+            
+            if not self.mcp_client or not self.running:
+                return
+            
+            try:
+                if await self.mcp_client.connect():
+                    logger.info("Reconnected to Cursor AI")
+                    return
+                
                 logger.error("Failed to reconnect to Cursor AI")
-                # Schedule another reconnect attempt
-                asyncio.create_task(self._reconnect())
-        except Exception as e:
-            logger.error(f"Error reconnecting to Cursor AI: {str(e)}")
-            # Schedule another reconnect attempt
-            asyncio.create_task(self._reconnect())
+            except Exception as e:
+                logger.error(f"Error reconnecting to Cursor AI: {str(e)}")
     
     def _service_thread(self) -> None:
         """Service thread function."""
@@ -225,6 +316,11 @@ class CoordinationService:
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         
+        # Run new tasks eagerly so coroutines that finish without
+        # suspending never get scheduled (Python 3.12+)
+        if sys.version_info >= (3, 12):
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+        
         # Create and run the main task
         main_task = self.loop.create_task(self._asyncio_main())
         
@@ -258,20 +354,12 @@ class CoordinationService:
             logger.info(f"Starting coordination service with instance ID: {self.instance_id}")
             
             # Create LLDB database directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.settings.lldb_database_path), exist_ok=True)
+            ensure_dir(os.path.dirname(self.settings.lldb_database_path))
             
             # Initialize CAICR
-            caicr_config = {
-                "instance_id": self.instance_id,
-                "project_root": self.settings.project_root,
-                "lldb_database_path": self.settings.lldb_database_path,
-                "coordination_port": self.settings.coordination_port,
-                "sync_interval_ms": self.settings.sync_interval_ms,
-                "max_history_entries": self.settings.max_history_entries,
-                "encryption_enabled": self.settings.encryption_enabled
-            }
-            
-            self.caicr_instance = self.caicr_binding.initialize(caicr_config)
+            self.caicr_instance = self.caicr_binding.initialize_from_settings(
+                self.settings, instance_id=self.instance_id
+            )
             
             # Register operation callback
             self.callback_id = self.caicr_binding.register_operation_callback(
@@ -280,6 +368,7 @@ class CoordinationService:
             
             # Start the service thread
             self.running = True
+            self._reconnect_attempt = 0
             self.thread = threading.Thread(target=self._service_thread, daemon=True)
             self.thread.start()
             
@@ -302,9 +391,18 @@ class CoordinationService:
         
         logger.info("Stopping coordination service...")
         
-        # Set the running flag to false to stop the thread
+        # Set the running flag to false and wake the service loop
         self.running = False
         
+        loop = self.loop
+        stop_event = self._stop_event
+        if loop and stop_event:
+            try:
+                loop.call_soon_threadsafe(stop_event.set)
+            except RuntimeError:
+                # The loop has already closed
+                pass
+        
         # Wait for the thread to finish
         if self.thread:
             self.thread.join(timeout=5)
@@ -326,6 +424,9 @@ class CoordinationService:
                 logger.error(f"Error shutting down CAICR: {str(e)}")
         
         logger.info("Coordination service stopped")
+        
+        # Flush queued log records
+        stop_logging()
     
     def undo(self) -> None:
         """
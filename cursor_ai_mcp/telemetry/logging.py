@@ -6,14 +6,25 @@ This module provides logging configuration for the Cursor AI
 coordination service.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, List
 
 # Default log format
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# Log file rotation
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
+# Background listener writing records queued by the root logger
+_listener: Optional[logging.handlers.QueueListener] = None
+_atexit_registered = False
+
 
 def setup_logger(
     level: Union[str, int] = "INFO",
@@ -23,6 +34,10 @@ def setup_logger(
     """
     Set up the logger for the application.
     
+    The root logger only gets a QueueHandler; the console and file
+    handlers run on a QueueListener thread, so logging calls never
+    block on stream or disk I/O. Call stop_logging() to flush the queue.
+    
     Args:
         level: Log level (e.g., "DEBUG", "INFO", "WARNING", "ERROR")
         log_file: Path to the log file (optional)
@@ -35,6 +50,11 @@ def setup_logger(
             raise ValueError(f"Invalid log level: {level}")
         level = numeric_level
     
+    global _listener, _atexit_registered
+    
+    # Stop any listener from a previous setup
+    stop_logging()
+    
     # Create root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -43,6 +63,8 @@ def setup_logger(
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
+    handlers: List[logging.Handler] = []
+    
     # Create formatter
     formatter = logging.Formatter(log_format)
     
@@ -50,19 +72,63 @@ def setup_logger(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # Create file handler if specified
     if log_file:
         # Create directory if it doesn't exist
         log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
+        if log_dir:
             os.makedirs(log_dir, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True
+        )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Hand records to the listener thread through a queue
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    
+    if not _atexit_registered:
+        atexit.register(stop_logging)
+        _atexit_registered = True
     
     # Set up library loggers
-    logging.getLogger("asyncio").setLevel(logging.WARNING) 
\ No newline at end of file
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+
+
+def stop_logging() -> None:
+    """
+    Stop the background log listener set up by setup_logger.
+    
+    Queued records are written out first. The listener's handlers are then
+    attached to the root logger directly, so anything logged afterwards is
+    still written (synchronously).
+    """
+    global _listener
+    
+    listener = _listener
+    if listener is None:
+        return
+    _listener = None
+    
+    listener.stop()
+    
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in listener.handlers:
+        root_logger.addHandler(handler) 
\ No newline at end of file
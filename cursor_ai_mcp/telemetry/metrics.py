@@ -9,26 +9,57 @@ coordination service.
 import os
 import json
 import time
+import array
 import threading
 import logging
-from typing import Dict, Any, Optional, List, Tuple, Union
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple, Union, Deque
+from dataclasses import dataclass, field
+
+from ..utils.fs import ensure_dir
 
 # Set up module logger
 logger = logging.getLogger(__name__)
 
+# Metrics fields backed by MetricsCollector's counter array, by index
+_COUNTER_FIELDS = (
+    "connection_count",
+    "disconnection_count",
+    "operations_received",
+    "operations_forwarded",
+    "undos",
+    "redos",
+)
+(
+    _IDX_CONNECTIONS,
+    _IDX_DISCONNECTIONS,
+    _IDX_OPS_RECEIVED,
+    _IDX_OPS_FORWARDED,
+    _IDX_UNDOS,
+    _IDX_REDOS,
+) = range(len(_COUNTER_FIELDS))
+
+
+# Number of most recent errors kept in the metrics
+MAX_ERRORS = 100
+
 
 @dataclass
 class Metrics:
-    """Metrics data structure."""
+    """
+    Metrics data structure.
+    
+    Event times are kept as time.monotonic_ns() readings and converted to
+    wall-clock seconds, relative to start_time, only in to_dict.
+    """
     
     instance_id: str
     
     # Connection metrics
     connection_count: int = 0
     disconnection_count: int = 0
-    last_connection_time: Optional[float] = None
-    last_disconnection_time: Optional[float] = None
+    last_connection_ns: Optional[int] = None
+    last_disconnection_ns: Optional[int] = None
     
     # Operation metrics
     operations_received: int = 0
@@ -36,15 +67,45 @@ class Metrics:
     undos: int = 0
     redos: int = 0
     
-    # Error metrics
-    errors: List[Dict[str, Any]] = field(default_factory=list)
+    # Error metrics as (time_ns, code, message), most recent MAX_ERRORS only
+    errors: Deque[Tuple[int, int, str]] = field(default_factory=lambda: deque(maxlen=MAX_ERRORS))
     
     # Performance metrics
     start_time: float = field(default_factory=time.time)
+    start_ns: int = field(default_factory=time.monotonic_ns)
+    
+    def _wall_time(self, time_ns: Optional[int]) -> Optional[float]:
+        """Convert a monotonic_ns reading to seconds since the epoch."""
+        if time_ns is None:
+            return None
+        return self.start_time + (time_ns - self.start_ns) / 1e9
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert metrics to a dictionary."""
-        return asdict(self)
+        """
+        Convert metrics to a dictionary.
+        
+        Built field by field rather than with dataclasses.asdict, which
+        deep-copies every field. Times are reported in seconds since the
+        epoch.
+        """
+        wall_time = self._wall_time
+        
+        return {
+            "instance_id": self.instance_id,
+            "connection_count": self.connection_count,
+            "disconnection_count": self.disconnection_count,
+            "last_connection_time": wall_time(self.last_connection_ns),
+            "last_disconnection_time": wall_time(self.last_disconnection_ns),
+            "operations_received": self.operations_received,
+            "operations_forwarded": self.operations_forwarded,
+            "undos": self.undos,
+            "redos": self.redos,
+            "errors": [
+                {"time": wall_time(time_ns), "code": code, "message": message}
+                for time_ns, code, message in self.errors
+            ],
+            "start_time": self.start_time,
+        }
 
 
 class MetricsCollector:
@@ -53,6 +114,10 @@ class MetricsCollector:
     
     This class provides thread-safe metrics collection and periodic
     writing to a metrics file.
+    
+    Event counters live in an array and are bumped without taking the
+    lock; the lock only guards the error list and snapshots, which copy
+    the counters into the Metrics dataclass.
     """
     
     def __init__(
@@ -73,8 +138,13 @@ class MetricsCollector:
         self.metrics_file = metrics_file
         self.write_interval = write_interval
         self.lock = threading.Lock()
+        self._counters = array.array("q", [0] * len(_COUNTER_FIELDS))
+        
+        # Set by every record_* call; the writer skips unchanged metrics
+        self._dirty = True
         self.writer_thread = None
         self.running = False
+        self._stop_event = threading.Event()
         
         # Start the writer thread if a metrics file is specified
         if self.metrics_file:
@@ -86,16 +156,16 @@ class MetricsCollector:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.writer_thread = threading.Thread(target=self._writer_thread_func, daemon=True)
         self.writer_thread.start()
     
     def _writer_thread_func(self) -> None:
         """Metrics writer thread function."""
-        while self.running:
+        # Wait first to allow some metrics to be collected; stop() sets
+        # the event to end the wait early
+        while not self._stop_event.wait(self.write_interval):
             try:
-                # Sleep first to allow some metrics to be collected
-                time.sleep(self.write_interval)
-                
                 # Write metrics to file
                 self._write_metrics()
                 
@@ -104,76 +174,110 @@ class MetricsCollector:
     
     def _write_metrics(self) -> None:
         """Write metrics to the metrics file."""
-        if not self.metrics_file:
+        if not self.metrics_file or not self._dirty:
             return
         
         try:
             # Create directory if it doesn't exist
             metrics_dir = os.path.dirname(self.metrics_file)
-            if metrics_dir and not os.path.exists(metrics_dir):
-                os.makedirs(metrics_dir, exist_ok=True)
+            ensure_dir(metrics_dir)
+            
+            # Clear the flag before taking the snapshot so events recorded
+            # meanwhile are picked up by the next write
+            self._dirty = False
             
             # Get a copy of the metrics with the lock
-            with self.lock:
-                metrics_dict = self.metrics.to_dict()
+            metrics_dict = self._snapshot()
             
-            # Write to file
-            with open(self.metrics_file, "w") as f:
-                json.dump(metrics_dict, f, indent=2)
+            # Write to a temporary file and rename it over the old one so
+            # readers never see a partially written file
+            temp_file = f"{self.metrics_file}.tmp"
+            try:
+                f = open(temp_file, "w")
+            except FileNotFoundError:
+                # The directory was removed after it was created
+                ensure_dir(metrics_dir, recheck=True)
+                f = open(temp_file, "w")
+            with f:
+                f.write(json.dumps(metrics_dict, separators=(",", ":")))
+            os.replace(temp_file, self.metrics_file)
                 
         except Exception as e:
+            self._dirty = True
             logger.error(f"Failed to write metrics to {self.metrics_file}: {str(e)}")
     
+    def _snapshot(self) -> Dict[str, Any]:
+        """Copy the counters into the metrics and return them as a dict."""
+        with self.lock:
+            metrics = self.metrics
+            for name, value in zip(_COUNTER_FIELDS, self._counters):
+                setattr(metrics, name, value)
+            return metrics.to_dict()
+    
     def record_connection(self) -> None:
         """Record a connection event."""
-        with self.lock:
-            self.metrics.connection_count += 1
-            self.metrics.last_connection_time = time.time()
+        self._counters[_IDX_CONNECTIONS] += 1
+        self.metrics.last_connection_ns = time.monotonic_ns()
+        
+        # Flag last so a concurrent write can't clear it before the
+        # timestamp lands
+        self._dirty = True
     
     def record_disconnection(self) -> None:
         """Record a disconnection event."""
-        with self.lock:
-            self.metrics.disconnection_count += 1
-            self.metrics.last_disconnection_time = time.time()
+        self._counters[_IDX_DISCONNECTIONS] += 1
+        self.metrics.last_disconnection_ns = time.monotonic_ns()
+        self._dirty = True
     
     def record_operation_received(self) -> None:
         """Record an operation received event."""
-        with self.lock:
-            self.metrics.operations_received += 1
+        self._counters[_IDX_OPS_RECEIVED] += 1
+        self._dirty = True
     
-    def record_operation_forwarded(self) -> None:
-        """Record an operation forwarded event."""
-        with self.lock:
-            self.metrics.operations_forwarded += 1
+    def record_operations_forwarded(self, count: int = 1) -> None:
+        """
+        Record a batch of operation forwarded events.
+        
+        Callers forwarding several operations at once should record them
+        with a single call rather than once per operation.
+        
+        Args:
+            count: Number of operations forwarded
+        """
+        self._counters[_IDX_OPS_FORWARDED] += count
+        self._dirty = True
+    
+    # Single-event form, kept for existing callers
+    record_operation_forwarded = record_operations_forwarded
     
     def record_undo(self) -> None:
         """Record an undo event."""
-        with self.lock:
-            self.metrics.undos += 1
+        self._counters[_IDX_UNDOS] += 1
+        self._dirty = True
     
     def record_redo(self) -> None:
         """Record a redo event."""
-        with self.lock:
-            self.metrics.redos += 1
+        self._counters[_IDX_REDOS] += 1
+        self._dirty = True
     
-    def record_error(self, code: int, message: str) -> None:
+    def record_error(self, code: int, message: str, time_ns: Optional[int] = None) -> None:
         """
         Record an error event.
         
         Args:
             code: Error code
             message: Error message
+            time_ns: time.monotonic_ns() of the error; callers recording
+                several errors at once can pass one reading for all of them
         """
+        if time_ns is None:
+            time_ns = time.monotonic_ns()
+        
         with self.lock:
-            self.metrics.errors.append({
-                "time": time.time(),
-                "code": code,
-                "message": message
-            })
-            
-            # Limit the number of stored errors
-            if len(self.metrics.errors) > 100:
-                self.metrics.errors = self.metrics.errors[-100:]
+            # The deque discards the oldest entry once MAX_ERRORS is reached
+            self.metrics.errors.append((time_ns, code, message))
+        
+        self._dirty = True
     
     def get_metrics(self) -> Dict[str, Any]:
         """
@@ -182,12 +286,12 @@ class MetricsCollector:
         Returns:
             Dict[str, Any]: Current metrics
         """
-        with self.lock:
-            return self.metrics.to_dict()
+        return self._snapshot()
     
     def stop(self) -> None:
         """Stop the metrics collector."""
         self.running = False
+        self._stop_event.set()
         
         if self.writer_thread and self.writer_thread.is_alive():
             self.writer_thread.join(timeout=5)
@@ -0,0 +1,35 @@
+# utils/fs.py
+"""
+Filesystem Utilities
+
+This module provides filesystem helpers shared by the Cursor AI
+coordination service.
+"""
+
+import os
+from typing import Set
+
+
+# Directories already created or found to exist by this process
+_VERIFIED_DIRS: Set[str] = set()
+
+
+def ensure_dir(path: str, recheck: bool = False) -> None:
+    """
+    Create a directory, and any missing parents, if it doesn't exist.
+    
+    Directories are remembered once created or found, so repeated calls
+    for the same path skip the makedirs() system calls. Pass recheck=True
+    after a file operation in the directory failed with FileNotFoundError,
+    in case the directory was removed since.
+    
+    Args:
+        path: Directory path; an empty path (the current directory) is ignored
+        recheck: Check the directory again even if it is remembered
+    """
+    if not path or (not recheck and path in _VERIFIED_DIRS):
+        return
+    
+    _VERIFIED_DIRS.discard(path)
+    os.makedirs(path, exist_ok=True)
+    _VERIFIED_DIRS.add(path)
\ No newline at end of file
@@ -7,7 +7,6 @@ Cursor AI coordination service.
 """
 
 import os
-import uuid
 import hmac
 import hashlib
 import base64
@@ -15,6 +14,42 @@ import secrets
 from typing import Optional, Tuple
 
 
+# Bytes produced per keystream block
+_KEYSTREAM_BLOCK_SIZE = 64
+
+
+def _derive_key(public_key: bytes, nonce: bytes) -> bytes:
+    """Derive a per-message key from the public key and nonce."""
+    return hashlib.blake2b(public_key + nonce, digest_size=32).digest()
+
+
+def _xor_keystream(data: bytes, key: bytes) -> bytes:
+    """
+    XOR data with a keystream derived from key.
+    
+    The keystream is keyed BLAKE2b over a block counter, so it never
+    repeats within a message. Data and keystream are converted to
+    integers so the XOR runs as a single C-level big-integer operation
+    instead of a Python loop per byte.
+    """
+    length = len(data)
+    if not length:
+        return b""
+    
+    # Key setup once; each block hashes its counter from a copy
+    keyed = hashlib.blake2b(key=key, digest_size=_KEYSTREAM_BLOCK_SIZE)
+    blocks = []
+    for counter in range((length + _KEYSTREAM_BLOCK_SIZE - 1) // _KEYSTREAM_BLOCK_SIZE):
+        block = keyed.copy()
+        block.update(counter.to_bytes(8, "little"))
+        blocks.append(block.digest())
+    keystream = b"".join(blocks)[:length]
+    
+    return (
+        int.from_bytes(data, "big") ^ int.from_bytes(keystream, "big")
+    ).to_bytes(length, "big")
+
+
 def generate_secure_id(prefix: str = "caicr-") -> str:
     """
     Generate a secure identifier.
@@ -25,11 +60,9 @@ def generate_secure_id(prefix: str = "caicr-") -> str:
     Returns:
         str: Secure identifier
     """
-    # Generate a UUID
-    id_uuid = uuid.uuid4()
-    
-    # Convert to string and add prefix
-    return f"{prefix}{id_uuid}"
+    # 128 random bits as hex; as unpredictable as a UUID4 without the
+    # version bits and dashed formatting
+    return f"{prefix}{secrets.token_hex(16)}"
 
 
 def generate_hmac(
@@ -48,8 +81,8 @@ def generate_hmac(
     Returns:
         bytes: HMAC signature
     """
-    h = hmac.new(key, message, getattr(hashlib, algorithm))
-    return h.digest()
+    # One-shot C implementation; no HMAC object or hashlib lookup per call
+    return hmac.digest(key, message, algorithm)
 
 
 def verify_hmac(
@@ -70,7 +103,7 @@ def verify_hmac(
     Returns:
         bool: True if the signature is valid, False otherwise
     """
-    expected = generate_hmac(message, key, algorithm)
+    expected = hmac.digest(key, message, algorithm)
     return hmac.compare_digest(signature, expected)
 
 
@@ -106,8 +139,8 @@ def encrypt_message(
     # This is a placeholder - in a real implementation, this would use
     # a proper cryptographic library like PyNaCl or cryptography
     nonce = secrets.token_bytes(24)
-    key = hashlib.sha256(public_key + nonce).digest()
-    encrypted = bytes([a ^ b for a, b in zip(message, key * (len(message) // len(key) + 1))])
+    key = _derive_key(public_key, nonce)
+    encrypted = _xor_keystream(message, key)
     
     return encrypted, nonce
 
@@ -131,7 +164,7 @@ def decrypt_message(
     # This is a placeholder - in a real implementation, this would use
     # a proper cryptographic library like PyNaCl or cryptography
     public_key = hashlib.sha256(private_key).digest()
-    key = hashlib.sha256(public_key + nonce).digest()
-    decrypted = bytes([a ^ b for a, b in zip(encrypted_message, key * (len(encrypted_message) // len(key) + 1))])
+    key = _derive_key(public_key, nonce)
+    decrypted = _xor_keystream(encrypted_message, key)
     
     return decrypted 
\ No newline at end of file
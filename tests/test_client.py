@@ -0,0 +1,35 @@
+# tests/test_client.py
+"""Tests for the MCP client."""
+
+import asyncio
+import unittest
+
+from cursor_ai_mcp.mcp.client import MCPClient, MCPClientError
+
+
+class MCPClientTest(unittest.TestCase):
+    """Tests for tracking in-flight requests."""
+    
+    def test_pending_requests_fail_when_connection_closes(self):
+        async def run():
+            client = MCPClient("127.0.0.1", 0, "local")
+            loop = asyncio.get_running_loop()
+            
+            # Sequence 1 + PENDING_SLOTS collides with 1 and overflows
+            futures = {}
+            for sequence in (1, 2, 1 + MCPClient.PENDING_SLOTS):
+                futures[sequence] = loop.create_future()
+                client._add_pending(sequence, futures[sequence])
+            
+            client._fail_pending()
+            
+            for sequence, future in futures.items():
+                with self.assertRaises(MCPClientError):
+                    future.result()
+                self.assertIsNone(client._pop_pending(sequence))
+        
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+# tests/test_metrics.py
+"""Tests for metrics collection."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from cursor_ai_mcp.telemetry.metrics import MetricsCollector
+
+
+class MetricsCollectorTest(unittest.TestCase):
+    """Tests for writing metrics to a file."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.metrics_dir = os.path.join(self.temp_dir, "metrics")
+        self.metrics_file = os.path.join(self.metrics_dir, "metrics.json")
+        self.collector = MetricsCollector("test", self.metrics_file)
+    
+    def tearDown(self):
+        self.collector.stop()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_write_recreates_removed_directory(self):
+        self.collector._write_metrics()
+        shutil.rmtree(self.metrics_dir)
+        
+        self.collector.record_connection()
+        self.collector._write_metrics()
+        
+        with open(self.metrics_file) as f:
+            self.assertEqual(json.load(f)["connection_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
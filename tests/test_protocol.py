@@ -0,0 +1,179 @@
+# tests/test_protocol.py
+"""Tests for MCP message encoding."""
+
+import asyncio
+import unittest
+
+from cursor_ai_mcp.mcp.protocol import (
+    MCPConnection, MCPMessage, MCPMessageHeader, MCPMessageType,
+    MCPProtocolError, _MSGPACK_CODEC
+)
+
+
+class MCPMessageTest(unittest.TestCase):
+    """Tests for packing and unpacking MCP messages."""
+    
+    def _round_trip(self, message, *codec):
+        frame = message.pack(*codec)
+        header = MCPMessageHeader.unpack(frame)
+        return MCPMessage.from_payload(header, frame[MCPMessageHeader.SIZE:], *codec)
+    
+    def test_int_keyed_payload(self):
+        message = MCPMessage.create_operation(7, {"content": {1: "x"}})
+        
+        decoded = self._round_trip(message)
+        
+        self.assertEqual(decoded.header.sequence, 7)
+        self.assertEqual(decoded.payload, {"operation": {"content": {"1": "x"}}})
+    
+    @unittest.skipIf(_MSGPACK_CODEC is None, "msgpack is not installed")
+    def test_int_keyed_payload_msgpack(self):
+        message = MCPMessage.create_operation(7, {"content": {1: "x"}})
+        
+        decoded = self._round_trip(message, _MSGPACK_CODEC)
+        
+        self.assertEqual(decoded.payload, {"operation": {"content": {1: "x"}}})
+    
+    def test_unencodable_payload_raises(self):
+        message = MCPMessage.create_operation(1, {"content": object()})
+        
+        with self.assertRaises(MCPProtocolError):
+            message.pack()
+
+
+class MCPConnectionTest(unittest.TestCase):
+    """Tests for queueing messages on an MCP connection."""
+    
+    def test_unencodable_payload_raises_to_caller(self):
+        async def run():
+            connection = MCPConnection(None, None, "local", "1.0.0")
+            connection.connected = True
+            
+            with self.assertRaises(MCPProtocolError):
+                connection.send_message_nowait(
+                    MCPMessage.create_operation(1, {"content": object()})
+                )
+            
+            self.assertTrue(connection._send_queue.empty())
+            
+            connection.send_message_nowait(MCPMessage.create_operation(2, {"content": "x"}))
+            self.assertEqual(connection._send_queue.qsize(), 1)
+        
+        asyncio.run(run())
+    
+    def test_full_send_queue_pushes_back_until_close(self):
+        closed = []
+        
+        class SmallQueueConnection(MCPConnection):
+            MAX_SEND_QUEUE = 2
+        
+        async def serve(reader, writer):
+            await reader.read()
+            writer.close()
+        
+        async def run():
+            server = await asyncio.start_server(serve, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            connection = SmallQueueConnection(
+                reader, writer, "local", "1.0.0", on_close=lambda: closed.append(True)
+            )
+            connection.connected = True
+            
+            # No sender task is running, so nothing leaves the queue
+            for sequence in (1, 2):
+                connection.send_message_nowait(MCPMessage.create_operation(sequence, {}))
+            with self.assertRaises(MCPProtocolError):
+                connection.send_message_nowait(MCPMessage.create_operation(3, {}))
+            
+            blocked = asyncio.ensure_future(
+                connection.send_message(MCPMessage.create_operation(4, {}))
+            )
+            await asyncio.sleep(0.01)
+            self.assertFalse(blocked.done())
+            
+            await connection.close()
+            with self.assertRaises(MCPProtocolError):
+                await blocked
+            
+            server.close()
+            await server.wait_closed()
+        
+        asyncio.run(asyncio.wait_for(run(), 5))
+        
+        self.assertEqual(closed, [True])
+    
+    def test_receiver_decodes_frames_split_across_reads(self):
+        received = []
+        
+        async def run():
+            reader = asyncio.StreamReader()
+            connection = MCPConnection(reader, None, "local", "1.0.0", received.append)
+            connection.connected = True
+            
+            frames = b"".join(
+                MCPMessage.create_operation(seq, {"content": seq}).pack()
+                for seq in (1, 2, 3)
+            )
+            split = len(frames) - 5
+            reader.feed_data(frames[:split])
+            task = asyncio.ensure_future(connection._receiver_loop())
+            await asyncio.sleep(0)
+            reader.feed_data(frames[split:])
+            await asyncio.sleep(0)
+            connection.connected = False
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        
+        asyncio.run(run())
+        
+        self.assertEqual(
+            [message.payload for message in received],
+            [{"operation": {"content": seq}} for seq in (1, 2, 3)]
+        )
+    
+    @unittest.skipIf(_MSGPACK_CODEC is None, "msgpack is not installed")
+    def test_handshake_switches_to_msgpack(self):
+        received = []
+        
+        async def serve(reader, writer):
+            handshake = await MCPMessage.from_reader(reader)
+            response = MCPMessage(
+                MCPMessageType.HANDSHAKE_RESPONSE,
+                0,
+                {"instance_id": "remote", "capabilities": handshake.payload["capabilities"]}
+            )
+            writer.write(response.pack())
+            
+            header = MCPMessageHeader.unpack(await reader.readexactly(MCPMessageHeader.SIZE))
+            payload = await reader.readexactly(header.length)
+            received.append(MCPMessage.from_payload(header, payload, _MSGPACK_CODEC).payload)
+            
+            # Hold the connection open until the client closes it
+            await reader.read()
+            writer.close()
+        
+        async def run():
+            server = await asyncio.start_server(serve, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            connection = MCPConnection(reader, writer, "local", "1.0.0")
+            
+            self.assertTrue(await connection.handshake())
+            self.assertIs(connection.codec, _MSGPACK_CODEC)
+            
+            await connection.send_message(MCPMessage.create_operation(1, {"content": {1: "x"}}))
+            while not received:
+                await asyncio.sleep(0.01)
+            
+            await connection.close()
+            server.close()
+            await server.wait_closed()
+        
+        asyncio.run(asyncio.wait_for(run(), 5))
+        
+        self.assertEqual(received, [{"operation": {"content": {1: "x"}}}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+# tests/test_settings.py
+"""Tests for configuration loading."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from cursor_ai_mcp.config.settings import load_settings
+
+
+class LoadSettingsTest(unittest.TestCase):
+    """Tests for load_settings and its cache."""
+    
+    def setUp(self):
+        fd, self.config_file = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+    
+    def tearDown(self):
+        os.unlink(self.config_file)
+    
+    def _write_config(self, config):
+        with open(self.config_file, "w") as f:
+            json.dump(config, f)
+    
+    def test_nested_additional_config_is_not_shared(self):
+        self._write_config({"additional_config": {"a": {"b": 1}}})
+        
+        first = load_settings(self.config_file, env_override=False)
+        first.additional_config["a"]["b"] = 2
+        
+        second = load_settings(self.config_file, env_override=False)
+        self.assertEqual(second.additional_config, {"a": {"b": 1}})
+    
+    def test_non_mapping_additional_config_is_ignored(self):
+        self._write_config({"additional_config": [1, 2], "log_level": "DEBUG"})
+        
+        with self.assertLogs("cursor_ai_mcp.config.settings", "WARNING"):
+            settings = load_settings(self.config_file, env_override=False)
+        
+        self.assertEqual(settings.additional_config, {})
+        self.assertEqual(settings.log_level, "DEBUG")
+
+
+if __name__ == "__main__":
+    unittest.main()